@@ -833,7 +833,8 @@ class NANDController:
         else:
             physical_block = block
 
-        self.bad_block_manager.mark_bad_block(physical_block)
+        with self.metadata_lock:
+            self.bad_block_manager.mark_bad_block(physical_block)
 
         # Invalidate any cached data for this block
         if self.cache_enabled:
@@ -859,6 +860,20 @@ class NANDController:
 
         return self.bad_block_manager.is_bad_block(physical_block)
 
+    def get_bad_block_mask(self):
+        """
+        Get the bad block status of every block at once, as is_bad_block would report it.
+
+        Returns:
+            numpy.ndarray: Boolean array indexed by block number, True for bad blocks
+        """
+        with self.metadata_lock:
+            mask = np.array(self.bad_block_manager.bad_block_table, dtype=bool)
+
+        # Logical blocks are remapped to good physical blocks by translate_address
+        mask[: self.user_blocks] = False
+        return mask
+
     def get_next_good_block(self, block):
         """
         Find the next good block starting from the given block.
@@ -1125,6 +1140,7 @@ class NANDController:
         """
         with self.stats_lock:
             elapsed_time = time.time() - self.stats["start_time"]
+            wear_table = self.wear_leveling_engine.wear_level_table
             stats = {
                 "reads": self.stats["reads"],
                 "writes": self.stats["writes"],
@@ -1136,10 +1152,10 @@ class NANDController:
                     "hit_ratio": self._calculate_hit_ratio(),
                 },
                 "wear_leveling": {
-                    "min_erase_count": int(self.wear_leveling_engine.wear_level_table.min()),
-                    "max_erase_count": int(self.wear_leveling_engine.wear_level_table.max()),
-                    "avg_erase_count": float(self.wear_leveling_engine.wear_level_table.mean()),
-                    "std_dev": float(self.wear_leveling_engine.wear_level_table.std()),
+                    "min_erase_count": int(wear_table.min()),
+                    "max_erase_count": int(wear_table.max()),
+                    "avg_erase_count": float(wear_table.mean()),
+                    "std_dev": float(wear_table.std()),
                 },
                 "bad_blocks": {
                     "count": int(sum(self.bad_block_manager.bad_block_table)),
@@ -1,23 +1,30 @@
 # src/ui/__init__.py
 
 # Main Window Components
-from .main_window import MainWindow, OperationWorker, WearLevelingGraph
+from .main_window import BatchOperationsModel, HexDumpModel, LogFilterProxyModel, LogModel, MainWindow, OperationWorker, StatsWorker, WearLevelingGraph
 
 # Result Viewer Components
-from .result_viewer import ResultViewer, ResultVisualizer
+from .result_viewer import RawDataWorker, ResultViewer, ResultVisualizer
 
 # Settings Dialog Components
-from .settings_dialog import SettingsDialog
+from .settings_dialog import ConfigLoader, SettingsDialog
 
 # Export public API
 __all__ = [
     # Main Window
     "MainWindow",
     "OperationWorker",
+    "StatsWorker",
+    "LogModel",
+    "LogFilterProxyModel",
+    "HexDumpModel",
+    "BatchOperationsModel",
     "WearLevelingGraph",
     # Settings Dialog
     "SettingsDialog",
+    "ConfigLoader",
     # Result Viewer
     "ResultViewer",
     "ResultVisualizer",
+    "RawDataWorker",
 ]
@@ -0,0 +1,10 @@
+# src/ui/brushes.py
+
+from PyQt5.QtGui import QBrush, QColor
+
+# Shared foreground brushes, so table rows, log entries and tree items don't allocate their own colors
+BRUSH_RED = QBrush(QColor(255, 0, 0))
+BRUSH_GREEN = QBrush(QColor(0, 128, 0))
+BRUSH_ORANGE = QBrush(QColor(255, 165, 0))
+BRUSH_BLACK = QBrush(QColor(0, 0, 0))
+BRUSH_GRAY = QBrush(QColor(128, 128, 128))
@@ -1,16 +1,19 @@
 # src/ui/main_window.py
 
+import itertools
 import json
 import os
 import re
 import time
+from collections import OrderedDict, deque
+from pathlib import Path
 
 import matplotlib
-from PyQt5.QtCore import QSize, Qt, QThread, QTimer, pyqtSignal
-from PyQt5.QtGui import QColor, QIcon
+import numpy as np
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QSize, QSortFilterProxyModel, QStringListModel, Qt, QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import (
     QAction,
-    QApplication,
     QComboBox,
     QDockWidget,
     QFileDialog,
@@ -25,15 +28,16 @@ from PyQt5.QtWidgets import (
     QPushButton,
     QStatusBar,
     QTableWidget,
+    QTableView,
     QTableWidgetItem,
     QTabWidget,
     QToolBar,
-    QTreeWidget,
-    QTreeWidgetItem,
+    QTreeView,
     QVBoxLayout,
     QWidget,
 )
 
+from src.ui.brushes import BRUSH_BLACK, BRUSH_GRAY, BRUSH_GREEN, BRUSH_ORANGE, BRUSH_RED
 from src.ui.result_viewer import ResultViewer
 from src.ui.settings_dialog import SettingsDialog
 from src.utils.logger import get_logger
@@ -42,6 +46,66 @@ matplotlib.use("Qt5Agg")
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 
+# Optional faster decoders for batch files; json is used when neither is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+LOG_LEVEL_BRUSHES = {
+    "CRITICAL": BRUSH_RED,
+    "ERROR": BRUSH_RED,
+    "WARNING": BRUSH_ORANGE,
+    "INFO": BRUSH_BLACK,
+    "DEBUG": BRUSH_GRAY,
+}
+
+# Maximum number of entries kept in the log dock; older entries are dropped
+MAX_LOG_ENTRIES = 5000
+
+# Delay in milliseconds for collecting new log entries before they are shown in the log dock
+LOG_FLUSH_INTERVAL = 100
+
+# Number of batch operations parsed before a chunk of rows is handed to the UI
+BATCH_LOAD_CHUNK_SIZE = 500
+
+# Number of erase count bins in the wear histogram shown by the result viewer
+WEAR_HISTOGRAM_BINS = 30
+
+# Block number referenced in an operation error message
+BLOCK_NUMBER_RE = re.compile(r"block\s+(\d+)", re.IGNORECASE)
+
+# Translation table for the hex dump's ASCII column: printable characters kept, "." elsewhere
+ASCII_BYTE_TABLE = bytes(b if 32 <= b <= 126 else 46 for b in range(256))
+
+# Status label colors keyed on the label's "state" property, applied once to the dashboard
+LABEL_STATE_STYLE_SHEET = """
+QLabel[state="good"] { color: green; font-weight: bold; }
+QLabel[state="ok"] { color: green; }
+QLabel[state="warn"] { color: orange; font-weight: bold; }
+QLabel[state="bad"] { color: red; font-weight: bold; }
+"""
+
+
+# Severity rank of each log level, lowest first
+LOG_LEVEL_RANKS = {"DEBUG": 0, "INFO": 1, "WARNING": 2, "ERROR": 3, "CRITICAL": 4}
+
+
+def should_show_log_level(level, min_level):
+    """Determine if a log level should be shown based on minimum level"""
+    level_rank = LOG_LEVEL_RANKS.get(level)
+    min_rank = LOG_LEVEL_RANKS.get(min_level)
+
+    if level_rank is None or min_rank is None:
+        return True
+
+    return level_rank >= min_rank
+
 
 class OperationWorker(QThread):
     """Worker thread to perform NAND operations without freezing the UI"""
@@ -116,6 +180,36 @@ class OperationWorker(QThread):
                     }
                     self.operation_complete.emit(test_results)
 
+            elif self.operation_type == "write_page":
+                block, page, data = self.args[0], self.args[1], self.args[2]
+                max_size = self.args[3] if len(self.args) > 3 else None
+
+                if isinstance(data, str):
+                    data = data.encode("utf-8")
+                if max_size is not None:
+                    data = data[:max_size]
+
+                self.nand_controller.write_page(block, page, data)
+                self.operation_complete.emit({"type": "write_page", "block": block, "page": page})
+
+            elif self.operation_type == "batch_operation":
+                row, operation = self.args[0], self.args[1]
+                op_type = operation.get("type", "unknown")
+
+                if op_type in ("read", "read_page"):
+                    self.nand_controller.read_page(int(operation["block"]), int(operation["page"]))
+                elif op_type in ("write", "write_page"):
+                    data = operation.get("data", "")
+                    if isinstance(data, str):
+                        data = data.encode("utf-8")
+                    self.nand_controller.write_page(int(operation["block"]), int(operation["page"]), data)
+                elif op_type in ("erase", "erase_block"):
+                    self.nand_controller.erase_block(int(operation["block"]))
+                else:
+                    raise ValueError(f"Unsupported batch operation type: {op_type}")
+
+                self.operation_complete.emit({"type": "batch_operation", "row": row, "operation": op_type})
+
             elif self.operation_type == "initialize":
                 self.nand_controller.initialize()
                 self.operation_complete.emit({"type": "initialize", "success": True})
@@ -131,6 +225,401 @@ class OperationWorker(QThread):
         self.is_canceled = True
 
 
+class StatsWorker(QThread):
+    """Worker thread to collect and format statistics without freezing the UI"""
+
+    stats_ready = pyqtSignal(dict)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, nand_controller):
+        super().__init__()
+        self.nand_controller = nand_controller
+
+    def run(self):
+        try:
+            device_info = self.nand_controller.get_device_info()
+
+            # Take the whole bad block table in one call so the block health table never queries the controller per row
+            bad_mask = self.nand_controller.get_bad_block_mask()
+
+            # The erase count histogram is only for the result viewer's wear plot, so it is built here,
+            # outside the controller's stats lock that the operation counters share
+            wear_stats = device_info.get("statistics", {}).get("wear_leveling")
+            if wear_stats is not None:
+                counts, edges = np.histogram(self.nand_controller.wear_leveling_engine.wear_level_table, bins=WEAR_HISTOGRAM_BINS)
+                wear_stats["histogram"] = [counts.tolist(), edges.tolist()]
+
+            labels, wear_data = self.format_statistics(device_info)
+            self.stats_ready.emit({"device_info": device_info, "labels": labels, "wear_data": wear_data, "bad_mask": bad_mask})
+
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    def format_statistics(self, device_info):
+        """Build the dashboard label texts and states for the given device information"""
+        labels = {}
+
+        # Device info labels
+        if "config" in device_info:
+            config = device_info["config"]
+            labels["page_size"] = (f"Page Size: {config.get('page_size', 'N/A')} bytes", None)
+            labels["block_size"] = (f"Block Size: {config.get('block_size', 'N/A')} pages", None)
+            labels["num_blocks"] = (f"Number of Blocks: {config.get('num_blocks', 'N/A')}", None)
+            labels["num_planes"] = (f"Number of Planes: {config.get('num_planes', 'N/A')}", None)
+            labels["user_blocks"] = (f"User Blocks: {config.get('user_blocks', 'N/A')}", None)
+
+        # Firmware info
+        if "firmware" in device_info:
+            firmware = device_info["firmware"]
+            labels["firmware_version"] = (f"Firmware Version: {firmware.get('version', 'N/A')}", None)
+
+        # Health indicators
+        if "status" in device_info:
+            status = device_info["status"]
+            if status.get("ready", False):
+                labels["status"] = ("Status: Ready", "good")
+            else:
+                labels["status"] = ("Status: Not Ready", "bad")
+
+        wear_data = None
+
+        # Statistics
+        if "statistics" in device_info:
+            stats = device_info["statistics"]
+
+            # Operation counts
+            labels["reads"] = (f"Reads: {stats.get('reads', 0)}", None)
+            labels["writes"] = (f"Writes: {stats.get('writes', 0)}", None)
+            labels["erases"] = (f"Erases: {stats.get('erases', 0)}", None)
+            labels["ecc_corrections"] = (f"ECC Corrections: {stats.get('ecc_corrections', 0)}", None)
+
+            # Performance metrics
+            if "performance" in stats:
+                perf = stats["performance"]
+                labels["ops_per_second"] = (f"Operations/Second: {perf.get('ops_per_second', 0):.2f}", None)
+
+            # Compression metrics
+            if "compression" in stats:
+                comp = stats["compression"]
+                labels["avg_compression"] = (f"Avg. Compression Ratio: {comp.get('avg_ratio', 1.0):.2f}x", None)
+
+            # Cache metrics
+            if "cache" in stats:
+                cache = stats["cache"]
+                hit_ratio = cache.get("hit_ratio", 0.0)
+                labels["cache_hit_ratio"] = (f"Cache Hit Ratio: {hit_ratio:.2f}%", None)
+                labels["cache_hits"] = (f"Cache Hit Ratio: {hit_ratio:.2f}%", None)
+
+            # Bad block metrics
+            if "bad_blocks" in stats:
+                bad_blocks = stats["bad_blocks"]
+                percentage = bad_blocks.get("percentage", 0.0)
+                count = bad_blocks.get("count", 0)
+                labels["bad_block_percentage"] = (f"Bad Block %: {percentage:.2f}%", None)
+
+                # Bad block indicator color based on percentage
+                if percentage > 5.0:
+                    bad_block_state = "bad"
+                elif percentage > 2.0:
+                    bad_block_state = "warn"
+                else:
+                    bad_block_state = "ok"
+                labels["bad_blocks"] = (f"Bad Blocks: {count} ({percentage:.2f}%)", bad_block_state)
+
+            # Wear leveling metrics
+            if "wear_leveling" in stats:
+                wear = stats["wear_leveling"]
+                min_count = wear.get("min_erase_count", 0)
+                max_count = wear.get("max_erase_count", 0)
+                avg_count = wear.get("avg_erase_count", 0.0)
+
+                labels["wear_level"] = (f"Wear Level: Min={min_count}, Max={max_count}, Avg={avg_count:.2f}", None)
+
+                # In a real implementation, we would get the full wear distribution
+                # For now, let's create a simplified representation
+                wear_data = {}
+                for i in range(10):  # Show 10 blocks
+                    if i == 0:
+                        wear_data[i] = min_count
+                    elif i == 9:
+                        wear_data[i] = max_count
+                    else:
+                        # Linear interpolation between min and max
+                        wear_data[i] = min_count + ((max_count - min_count) * (i / 9))
+
+        return labels, wear_data
+
+
+class BatchLoaderWorker(QThread):
+    """Worker thread to parse a batch file and format its table rows without freezing the UI"""
+
+    rows_loaded = pyqtSignal(list)
+    load_complete = pyqtSignal(int)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, file_path, chunk_size=BATCH_LOAD_CHUNK_SIZE):
+        super().__init__()
+        self.file_path = file_path
+        self.chunk_size = chunk_size
+
+    def run(self):
+        try:
+            count = 0
+            chunk = []
+            with open(self.file_path, "rb") as f:
+                for operation in self.iter_operations(f):
+                    params = {key: value for key, value in operation.items() if key != "type"}
+                    chunk.append((operation, operation.get("type", "unknown"), str(params)))
+
+                    if len(chunk) >= self.chunk_size:
+                        count += len(chunk)
+                        self.rows_loaded.emit(chunk)
+                        chunk = []
+
+            if chunk:
+                count += len(chunk)
+                self.rows_loaded.emit(chunk)
+
+            self.load_complete.emit(count)
+
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    def iter_operations(self, f):
+        """Yield the operations of a top-level JSON list, preferring orjson, then streaming with ijson, then json
+
+        Any other top-level document yields no operations, whichever decoder is used.
+        """
+        if orjson is None and ijson is not None:
+            events = ijson.parse(f, use_float=True)
+            first = next(events)
+            if first != ("", "start_array", None):
+                # The "item" prefix would also match an object member named item, so check the top level first;
+                # the rest is still parsed so malformed files fail as they do with json
+                for _ in events:
+                    pass
+                return
+            yield from ijson.items(itertools.chain([first], events), "item")
+            return
+
+        batch_data = orjson.loads(f.read()) if orjson is not None else json.load(f)
+        if isinstance(batch_data, list):
+            yield from batch_data
+
+
+class LogModel(QAbstractTableModel):
+    """Bounded, newest-first model of log entries for the log dock"""
+
+    HEADERS = ["Time", "Level", "Message"]
+
+    def __init__(self, max_entries=MAX_LOG_ENTRIES, parent=None):
+        super().__init__(parent)
+        self.entries = deque(maxlen=max_entries)
+
+    def rowCount(self, parent=None):
+        return 0 if parent is not None and parent.isValid() else len(self.entries)
+
+    def columnCount(self, parent=None):
+        return 0 if parent is not None and parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        entry = self.entries[index.row()]
+        if role == Qt.DisplayRole:
+            return entry[index.column()]
+        if role == Qt.ForegroundRole and index.column() == 2:
+            return LOG_LEVEL_BRUSHES.get(entry[1])
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def add_entry(self, timestamp, level, message):
+        """Insert an entry at the top, dropping the oldest one when the buffer is full"""
+        if len(self.entries) == self.entries.maxlen:
+            last = len(self.entries) - 1
+            self.beginRemoveRows(QModelIndex(), last, last)
+            self.entries.pop()
+            self.endRemoveRows()
+
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        self.entries.appendleft((timestamp, level, message))
+        self.endInsertRows()
+
+    def add_entries(self, new_entries):
+        """Insert entries, oldest first, at the top in one step, dropping the oldest ones beyond the limit"""
+        if not new_entries:
+            return
+
+        # A batch that fills the whole buffer replaces everything
+        if len(new_entries) >= self.entries.maxlen:
+            self.beginResetModel()
+            self.entries.clear()
+            self.entries.extendleft(new_entries[-self.entries.maxlen :])
+            self.endResetModel()
+            return
+
+        overflow = len(self.entries) + len(new_entries) - self.entries.maxlen
+        if overflow > 0:
+            first = len(self.entries) - overflow
+            self.beginRemoveRows(QModelIndex(), first, len(self.entries) - 1)
+            for _ in range(overflow):
+                self.entries.pop()
+            self.endRemoveRows()
+
+        self.beginInsertRows(QModelIndex(), 0, len(new_entries) - 1)
+        self.entries.extendleft(new_entries)
+        self.endInsertRows()
+
+    def clear(self):
+        """Remove all entries"""
+        self.beginResetModel()
+        self.entries.clear()
+        self.endResetModel()
+
+
+class HexDumpModel(QAbstractTableModel):
+    """Hex dump of a byte buffer, 16 bytes per row, formatted only when a row is displayed"""
+
+    HEADERS = ["Offset", "Data"]
+    BYTES_PER_ROW = 16
+    CACHE_ROWS = 512
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.buffer = b""
+        # Recently formatted data column strings by row, least recently used first
+        self.row_cache = OrderedDict()
+
+    def rowCount(self, parent=None):
+        if parent is not None and parent.isValid():
+            return 0
+        return (len(self.buffer) + self.BYTES_PER_ROW - 1) // self.BYTES_PER_ROW
+
+    def columnCount(self, parent=None):
+        return 0 if parent is not None and parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+
+        row = index.row()
+        if index.column() == 0:
+            return f"0x{row * self.BYTES_PER_ROW:04X}"
+
+        # Repaints ask for the same visible rows repeatedly, so keep the last few formatted
+        text = self.row_cache.get(row)
+        if text is not None:
+            self.row_cache.move_to_end(row)
+            return text
+
+        offset = row * self.BYTES_PER_ROW
+        chunk = self.buffer[offset : offset + self.BYTES_PER_ROW]
+        # A single C-level pass per column; packing the row into an int and formatting that is much slower
+        hex_data = chunk.hex(" ").upper()
+        ascii_data = chunk.translate(ASCII_BYTE_TABLE).decode("latin-1")
+        text = f"{hex_data}  |  {ascii_data}"
+
+        self.row_cache[row] = text
+        if len(self.row_cache) > self.CACHE_ROWS:
+            self.row_cache.popitem(last=False)
+        return text
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def set_bytes(self, data):
+        """Replace the displayed buffer"""
+        self.beginResetModel()
+        self.buffer = bytes(data) if data else b""
+        self.row_cache.clear()
+        self.endResetModel()
+
+
+class BatchOperationsModel(QAbstractTableModel):
+    """Batch operations loaded from a file, with their display text and run status"""
+
+    HEADERS = ["Operation", "Parameters", "Status"]
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.operations = []
+        # [operation type, parameters, status] per operation
+        self.rows = []
+
+    def rowCount(self, parent=None):
+        return 0 if parent is not None and parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=None):
+        return 0 if parent is not None and parent.isValid() else len(self.HEADERS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role != Qt.DisplayRole:
+            return None
+        return self.rows[index.row()][index.column()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
+
+    def append_operations(self, rows):
+        """Append (operation, operation type, parameters) rows as pending operations"""
+        if not rows:
+            return
+
+        first = len(self.rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        for operation, op_type, params in rows:
+            self.operations.append(operation)
+            self.rows.append([op_type, params, "Pending"])
+        self.endInsertRows()
+
+    def set_status(self, row, status):
+        """Change the status of one operation in place, notifying views only when it differs"""
+        if self.rows[row][2] == status:
+            return
+
+        self.rows[row][2] = status
+        index = self.index(row, 2)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def clear(self):
+        """Remove all operations"""
+        self.beginResetModel()
+        self.operations = []
+        self.rows = []
+        self.endResetModel()
+
+
+class LogFilterProxyModel(QSortFilterProxyModel):
+    """Proxy model that hides log entries below the selected minimum level"""
+
+    def __init__(self, min_level="INFO", parent=None):
+        super().__init__(parent)
+        self.min_level = min_level
+        self.min_rank = LOG_LEVEL_RANKS.get(min_level)
+
+    def set_min_level(self, min_level):
+        """Change the minimum level and re-filter the entries"""
+        self.min_level = min_level
+        self.min_rank = LOG_LEVEL_RANKS.get(min_level)
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        # Compare against the rank cached when the filter level was chosen
+        level_rank = LOG_LEVEL_RANKS.get(self.sourceModel().entries[source_row][1])
+        if level_rank is None or self.min_rank is None:
+            return True
+        return level_rank >= self.min_rank
+
+
 class WearLevelingGraph(FigureCanvas):
     """Canvas for wear leveling visualization"""
 
@@ -175,7 +664,8 @@ class WearLevelingGraph(FigureCanvas):
 
         # Use subplots_adjust instead of tight_layout to prevent warnings
         self.fig.subplots_adjust(bottom=0.15, left=0.15, top=0.9, right=0.95)
-        self.draw()
+        # Defer the render so back-to-back statistics updates draw once
+        self.draw_idle()
 
 
 class MainWindow(QMainWindow):
@@ -189,13 +679,60 @@ class MainWindow(QMainWindow):
         self.settings_dialog = None
         self.worker = None
         self.is_initialized = False
+        self.template_verified = False
+
+        self.stats_worker = None
+        self.stats_update_pending = False
+        self.latest_stats = None
+        self.combos_pending = False
+        self.block_health_dirty = False
+        self.block_health_items = []
+        self.block_health_visible_rows = 0
+
+        # Bad block answers given by the controller since the last statistics snapshot
+        self.bad_block_cache = {}
+
+        # Controller's reserved block numbers, refreshed when settings are applied
+        self.reserved_block_set = frozenset()
+        self.refresh_reserved_blocks()
+
+        # Device info held back from the result viewer while its tab is hidden
+        self.pending_result = None
+
+        # Batch operations from batch_model run in lanes: operations on the same block run in
+        # order, and separate lanes run concurrently on up to batch_max_workers workers
+        self.batch_pending_lanes = deque()
+        self.batch_workers = set()
+        self.batch_running = False
+        self.batch_loader = None
+        self.batch_max_workers = max(1, getattr(nand_controller, "max_threads", 4))
+
+        # Last text/state applied to each status label, used to skip redundant repaints
+        self.last_label_values = {}
+
+        # Timestamp string of the last log entry, reused for entries within the same second
+        self.last_log_second = None
+        self.last_log_timestamp = ""
+
+        # Log entries waiting to be shown; flushed to the log dock together
+        self.pending_log_entries = []
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.setInterval(LOG_FLUSH_INTERVAL)
+        self.log_flush_timer.timeout.connect(self.flush_log_entries)
 
         # Set up UI components
         self.init_ui()
 
+        # Coalesce bursts of refresh requests into a single statistics update
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.setSingleShot(True)
+        self.refresh_timer.setInterval(200)
+        self.refresh_timer.timeout.connect(self.update_statistics)
+
         # Update timer for refreshing stats
         self.update_timer = QTimer(self)
-        self.update_timer.timeout.connect(self.update_statistics)
+        self.update_timer.timeout.connect(self.schedule_statistics_update)
         self.update_timer.start(5000)  # Update every 5 seconds
 
         # Initialize NAND controller
@@ -242,6 +779,7 @@ class MainWindow(QMainWindow):
         # Add result viewer tab
         self.result_viewer = ResultViewer(self)
         self.central_widget.addTab(self.result_viewer, "Results")
+        self.central_widget.currentChanged.connect(self.handle_tab_changed)
 
         # Create dock for log messages
         self.create_log_dock()
@@ -335,6 +873,7 @@ class MainWindow(QMainWindow):
     def create_dashboard_widget(self):
         """Create the dashboard tab content"""
         dashboard = QWidget()
+        dashboard.setStyleSheet(LABEL_STATE_STYLE_SHEET)
         layout = QVBoxLayout(dashboard)
 
         # Status section
@@ -372,7 +911,7 @@ class MainWindow(QMainWindow):
         # Apply special formatting to indicators
         for key, label in self.health_indicators.items():
             if key == "status":
-                label.setStyleSheet("color: orange; font-weight: bold;")
+                self.set_label(label, label.text(), "warn")
             health_layout.addWidget(label)
 
         device_info_layout.addLayout(health_layout)
@@ -419,6 +958,9 @@ class MainWindow(QMainWindow):
         for label in self.performance_stats.values():
             perf_layout.addWidget(label)
 
+        # All statistics labels by key, as produced by StatsWorker.format_statistics
+        self.stat_labels = {**self.device_info_labels, **self.health_indicators, **self.operation_stats, **self.performance_stats}
+
         stats_layout.addLayout(perf_layout)
 
         # Add placeholder for wear leveling graph
@@ -474,6 +1016,10 @@ class MainWindow(QMainWindow):
         operations = QWidget()
         layout = QVBoxLayout(operations)
 
+        # Block and page lists shared by the read and write combo boxes
+        self.block_model = QStringListModel(self)
+        self.page_model = QStringListModel(self)
+
         # Read operations section
         read_group = QGroupBox("Read Operations")
         read_layout = QVBoxLayout()
@@ -482,10 +1028,12 @@ class MainWindow(QMainWindow):
         read_params_layout = QHBoxLayout()
         read_params_layout.addWidget(QLabel("Block:"))
         self.read_block_combo = QComboBox()
+        self.read_block_combo.setModel(self.block_model)
         read_params_layout.addWidget(self.read_block_combo)
 
         read_params_layout.addWidget(QLabel("Page:"))
         self.read_page_combo = QComboBox()
+        self.read_page_combo.setModel(self.page_model)
         read_params_layout.addWidget(self.read_page_combo)
 
         read_button = QPushButton("Read Page")
@@ -495,9 +1043,15 @@ class MainWindow(QMainWindow):
         read_layout.addLayout(read_params_layout)
 
         # Read results
-        self.read_results_table = QTableWidget(0, 2)
-        self.read_results_table.setHorizontalHeaderLabels(["Offset", "Data"])
+        self.read_results_model = HexDumpModel(self)
+        self.read_results_table = QTableView()
+        self.read_results_table.setModel(self.read_results_model)
+        self.read_results_table.verticalHeader().setVisible(False)
+        # Fixed section sizes so the view never measures every row to lay itself out
+        self.read_results_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.read_results_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Fixed)
         self.read_results_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
+        self.read_results_table.setColumnWidth(0, 80)
         read_layout.addWidget(self.read_results_table)
 
         read_group.setLayout(read_layout)
@@ -511,10 +1065,12 @@ class MainWindow(QMainWindow):
         write_params_layout = QHBoxLayout()
         write_params_layout.addWidget(QLabel("Block:"))
         self.write_block_combo = QComboBox()
+        self.write_block_combo.setModel(self.block_model)
         write_params_layout.addWidget(self.write_block_combo)
 
         write_params_layout.addWidget(QLabel("Page:"))
         self.write_page_combo = QComboBox()
+        self.write_page_combo.setModel(self.page_model)
         write_params_layout.addWidget(self.write_page_combo)
 
         write_button = QPushButton("Write Page")
@@ -547,8 +1103,9 @@ class MainWindow(QMainWindow):
 
         batch_layout.addLayout(batch_buttons_layout)
 
-        self.batch_table = QTableWidget(0, 3)
-        self.batch_table.setHorizontalHeaderLabels(["Operation", "Parameters", "Status"])
+        self.batch_model = BatchOperationsModel(self)
+        self.batch_table = QTableView()
+        self.batch_table.setModel(self.batch_model)
         self.batch_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.Stretch)
         batch_layout.addWidget(self.batch_table)
 
@@ -588,7 +1145,7 @@ class MainWindow(QMainWindow):
         controls_layout.addWidget(self.count_combo)
 
         refresh_button = QPushButton("Refresh")
-        refresh_button.clicked.connect(self.update_block_health_table)
+        refresh_button.clicked.connect(self.schedule_statistics_update)
         controls_layout.addWidget(refresh_button)
 
         block_health_layout.addLayout(controls_layout)
@@ -622,8 +1179,14 @@ class MainWindow(QMainWindow):
         log_widget = QWidget()
         log_layout = QVBoxLayout(log_widget)
 
-        self.log_tree = QTreeWidget()
-        self.log_tree.setHeaderLabels(["Time", "Level", "Message"])
+        self.log_model = LogModel(parent=self)
+        self.log_proxy = LogFilterProxyModel(parent=self)
+        self.log_proxy.setSourceModel(self.log_model)
+
+        self.log_tree = QTreeView()
+        self.log_tree.setRootIsDecorated(False)
+        self.log_tree.setUniformRowHeights(True)
+        self.log_tree.setModel(self.log_proxy)
         self.log_tree.header().setSectionResizeMode(2, QHeaderView.Stretch)
 
         log_layout.addWidget(self.log_tree)
@@ -636,6 +1199,8 @@ class MainWindow(QMainWindow):
         self.log_level_combo = QComboBox()
         self.log_level_combo.addItems(["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"])
         self.log_level_combo.setCurrentIndex(1)  # INFO by default
+        self.log_proxy.set_min_level(self.log_level_combo.currentText())
+        self.log_level_combo.currentTextChanged.connect(self.log_proxy.set_min_level)
         log_controls.addWidget(self.log_level_combo)
 
         clear_logs_button = QPushButton("Clear Logs")
@@ -689,8 +1254,7 @@ class MainWindow(QMainWindow):
         self.init_button.setText("NAND Controller Initialized")
         self.init_button.setEnabled(False)
         self.add_log_entry("INFO", "NAND controller initialization completed")
-        self.health_indicators["status"].setText("Status: Ready")
-        self.health_indicators["status"].setStyleSheet("color: green; font-weight: bold;")
+        self.set_label(self.health_indicators["status"], "Status: Ready", "good")
 
         # Reset progress UI
         self.progress_bar.setVisible(False)
@@ -699,8 +1263,7 @@ class MainWindow(QMainWindow):
         self.worker = None
 
         # Update UI with initial data
-        self.update_statistics()
-        self.populate_block_page_combos()
+        self.full_refresh()
 
         # Update status bar
         self.statusBar.showMessage("NAND controller initialized successfully", 5000)
@@ -760,126 +1323,139 @@ class MainWindow(QMainWindow):
         # Update status bar
         self.statusBar.showMessage("NAND controller initialization failed", 5000)
 
+    def schedule_statistics_update(self):
+        """Request a statistics update, merging requests that arrive within the refresh interval"""
+        # Restarting a pending single-shot timer collapses the burst into one update
+        self.refresh_timer.start()
+
+    def full_refresh(self):
+        """Refresh statistics, tables and the block/page combos from a single device info snapshot"""
+        self.combos_pending = True
+        self.schedule_statistics_update()
+
     def update_statistics(self):
-        """Update UI with latest statistics from the NAND controller"""
+        """Collect the latest statistics from the NAND controller in a background thread"""
         if not self.is_initialized:
             return
 
-        try:
-            # Get device information and statistics
-            device_info = self.nand_controller.get_device_info()
+        # A collection is already running; refresh once more when it reports back
+        if self.stats_worker is not None:
+            self.stats_update_pending = True
+            return
 
-            # Update device info labels
-            if "config" in device_info:
-                config = device_info["config"]
-                self.device_info_labels["page_size"].setText(f"Page Size: {config.get('page_size', 'N/A')} bytes")
-                self.device_info_labels["block_size"].setText(f"Block Size: {config.get('block_size', 'N/A')} pages")
-                self.device_info_labels["num_blocks"].setText(f"Number of Blocks: {config.get('num_blocks', 'N/A')}")
-                self.device_info_labels["num_planes"].setText(f"Number of Planes: {config.get('num_planes', 'N/A')}")
-                self.device_info_labels["user_blocks"].setText(f"User Blocks: {config.get('user_blocks', 'N/A')}")
-
-            # Update firmware info
-            if "firmware" in device_info:
-                firmware = device_info["firmware"]
-                self.device_info_labels["firmware_version"].setText(f"Firmware Version: {firmware.get('version', 'N/A')}")
-
-            # Update health indicators
-            if "status" in device_info:
-                status = device_info["status"]
-                if status.get("ready", False):
-                    self.health_indicators["status"].setText("Status: Ready")
-                    self.health_indicators["status"].setStyleSheet("color: green; font-weight: bold;")
-                else:
-                    self.health_indicators["status"].setText("Status: Not Ready")
-                    self.health_indicators["status"].setStyleSheet("color: red; font-weight: bold;")
-
-            # Update statistics
-            if "statistics" in device_info:
-                stats = device_info["statistics"]
-
-                # Operation counts
-                self.operation_stats["reads"].setText(f"Reads: {stats.get('reads', 0)}")
-                self.operation_stats["writes"].setText(f"Writes: {stats.get('writes', 0)}")
-                self.operation_stats["erases"].setText(f"Erases: {stats.get('erases', 0)}")
-                self.operation_stats["ecc_corrections"].setText(f"ECC Corrections: {stats.get('ecc_corrections', 0)}")
-
-                # Performance metrics
-                if "performance" in stats:
-                    perf = stats["performance"]
-                    self.performance_stats["ops_per_second"].setText(f"Operations/Second: {perf.get('ops_per_second', 0):.2f}")
-
-                # Compression metrics
-                if "compression" in stats:
-                    comp = stats["compression"]
-                    self.performance_stats["avg_compression"].setText(f"Avg. Compression Ratio: {comp.get('avg_ratio', 1.0):.2f}x")
-
-                # Cache metrics
-                if "cache" in stats:
-                    cache = stats["cache"]
-                    hit_ratio = cache.get("hit_ratio", 0.0)
-                    self.performance_stats["cache_hit_ratio"].setText(f"Cache Hit Ratio: {hit_ratio:.2f}%")
-                    self.health_indicators["cache_hits"].setText(f"Cache Hit Ratio: {hit_ratio:.2f}%")
-
-                # Bad block metrics
-                if "bad_blocks" in stats:
-                    bad_blocks = stats["bad_blocks"]
-                    percentage = bad_blocks.get("percentage", 0.0)
-                    count = bad_blocks.get("count", 0)
-                    self.performance_stats["bad_block_percentage"].setText(f"Bad Block %: {percentage:.2f}%")
-                    self.health_indicators["bad_blocks"].setText(f"Bad Blocks: {count} ({percentage:.2f}%)")
-
-                    # Update bad block indicator color based on percentage
-                    if percentage > 5.0:
-                        self.health_indicators["bad_blocks"].setStyleSheet("color: red; font-weight: bold;")
-                    elif percentage > 2.0:
-                        self.health_indicators["bad_blocks"].setStyleSheet("color: orange; font-weight: bold;")
-                    else:
-                        self.health_indicators["bad_blocks"].setStyleSheet("color: green;")
-
-                # Wear leveling metrics
-                if "wear_leveling" in stats:
-                    wear = stats["wear_leveling"]
-                    min_count = wear.get("min_erase_count", 0)
-                    max_count = wear.get("max_erase_count", 0)
-                    avg_count = wear.get("avg_erase_count", 0.0)
-                    std_dev = wear.get("std_dev", 0.0)
-
-                    self.health_indicators["wear_level"].setText(f"Wear Level: Min={min_count}, Max={max_count}, Avg={avg_count:.2f}")
-
-                    # Update wear level wear_leveling graph
-                    # In a real implementation, we would get the full wear distribution
-                    # For now, let's create a simplified representation
-                    wear_data = {}
-                    for i in range(10):  # Show 10 blocks
-                        if i == 0:
-                            wear_data[i] = min_count
-                        elif i == 9:
-                            wear_data[i] = max_count
-                        else:
-                            # Linear interpolation between min and max
-                            wear_data[i] = min_count + ((max_count - min_count) * (i / 9))
-
-                    self.wear_leveling_graph.update_data(wear_data)
-
-            # Update block health table
-            self.update_block_health_table()
+        self.stats_worker = StatsWorker(self.nand_controller)
+        self.stats_worker.stats_ready.connect(self.apply_statistics)
+        self.stats_worker.error_occurred.connect(self.handle_statistics_error)
+        self.stats_worker.finished.connect(self.handle_statistics_finished)
+        self.stats_worker.start()
 
-            # Update the UI
-            self.result_viewer.update_results(device_info)
+    def apply_statistics(self, prepared):
+        """Update UI with statistics prepared by a StatsWorker"""
+        try:
+            self.latest_stats = prepared
+            # The snapshot's bad block mask supersedes individually cached answers
+            self.bad_block_cache = {}
+
+            # Repopulate the block/page combos from this snapshot if a full refresh asked for it
+            if self.combos_pending:
+                self.combos_pending = False
+                self.populate_block_page_combos(prepared["device_info"])
+
+            # Update dashboard labels
+            for key, (text, state) in prepared["labels"].items():
+                self.set_label(self.stat_labels[key], text, state)
+
+            # Update wear leveling graph
+            if prepared["wear_data"] is not None:
+                self.wear_leveling_graph.update_data(prepared["wear_data"])
+
+            # Update block health table, or defer it until the monitoring tab is shown
+            if self.central_widget.currentWidget() is self.monitoring_widget:
+                self.update_block_health_table()
+            else:
+                self.block_health_dirty = True
+
+            # Update the result viewer, or keep the latest snapshot until its tab is shown
+            if self.central_widget.currentWidget() is self.result_viewer:
+                self.result_viewer.update_results(prepared["device_info"])
+            else:
+                self.pending_result = prepared["device_info"]
 
         except Exception as e:
-            self.logger.error(f"Error updating statistics: {str(e)}")
-            self.add_log_entry("ERROR", f"Error updating statistics: {str(e)}")
+            self.handle_statistics_error(str(e))
+
+    def handle_statistics_error(self, error_message):
+        """Handle failure to collect or apply statistics"""
+        self.logger.error(f"Error updating statistics: {error_message}")
+        self.add_log_entry("ERROR", f"Error updating statistics: {error_message}")
+
+    def handle_statistics_finished(self):
+        """Release the finished stats worker and run any update requested meanwhile"""
+        # finished is emitted just before the thread exits; make sure it has before dropping the last reference
+        self.stats_worker.wait()
+        self.stats_worker = None
+
+        if self.stats_update_pending:
+            self.stats_update_pending = False
+            self.schedule_statistics_update()
+
+    def set_label(self, label, text, state=None):
+        """Set a label's text and style state, skipping assignments that would not change anything"""
+        last_text, last_state = self.last_label_values.get(label, (None, None))
+
+        if text != last_text:
+            label.setText(text)
+
+        # Colors come from LABEL_STATE_STYLE_SHEET; flipping the property only needs a re-polish
+        if state is not None and state != last_state:
+            label.setProperty("state", state)
+            label.style().unpolish(label)
+            label.style().polish(label)
+            last_state = state
+
+        self.last_label_values[label] = (text, last_state)
+
+    def is_bad_block_cached(self, block):
+        """Check whether a block is bad, reusing the latest statistics snapshot or an earlier answer"""
+        is_bad = self.bad_block_cache.get(block)
+        if is_bad is not None:
+            return is_bad
+
+        if self.latest_stats is not None and 0 <= block < len(self.latest_stats["bad_mask"]):
+            is_bad = bool(self.latest_stats["bad_mask"][block])
+        else:
+            is_bad = self.nand_controller.is_bad_block(block)
+
+        self.bad_block_cache[block] = is_bad
+        return is_bad
+
+    def handle_tab_changed(self, index):
+        """Bring deferred views up to date when the monitoring or results tab is shown"""
+        widget = self.central_widget.widget(index)
+
+        if self.block_health_dirty and widget is self.monitoring_widget:
+            self.update_block_health_table()
+
+        if self.pending_result is not None and widget is self.result_viewer:
+            pending_result = self.pending_result
+            self.pending_result = None
+            self.result_viewer.update_results(pending_result)
 
     def update_block_health_table(self):
         """Update the block health table"""
         if not self.is_initialized:
             return
 
-        try:
-            # Clear the table
-            self.block_health_table.setRowCount(0)
+        self.block_health_dirty = False
 
+        # Suspend sorting, repaints and item signals while rows are rebuilt
+        table = self.block_health_table
+        sorting_enabled = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
+
+        try:
             # Get the number of blocks to show
             count_text = self.count_combo.currentText()
             if count_text == "All":
@@ -890,8 +1466,11 @@ class MainWindow(QMainWindow):
             # Get filter type
             show_type = self.show_combo.currentText()
 
-            # Get device information
-            device_info = self.nand_controller.get_device_info()
+            # Use the device information from the latest statistics snapshot
+            if self.latest_stats is None:
+                return
+            device_info = self.latest_stats["device_info"]
+            bad_mask = self.latest_stats["bad_mask"]
             num_blocks = device_info.get("config", {}).get("num_blocks", 0)
 
             # Create a list of blocks to show
@@ -903,120 +1482,120 @@ class MainWindow(QMainWindow):
                 # In a real implementation, you would get actual bad blocks
                 # For now, we'll just show a few random blocks
                 for i in range(min(count, 10)):
-                    blocks_to_show.append(int(num_blocks * i / 10))
+                    blocks_to_show.append(num_blocks * i // 10)
             elif show_type == "Most Worn Blocks":
                 # In a real implementation, you would get actual most worn blocks
                 # For now, we'll just show a few random blocks
                 for i in range(min(count, 10)):
-                    blocks_to_show.append(int(num_blocks * i / 10))
+                    blocks_to_show.append(num_blocks * i // 10)
             elif show_type == "Least Worn Blocks":
                 # In a real implementation, you would get actual least worn blocks
                 # For now, we'll just show a few random blocks
                 for i in range(min(count, 10)):
-                    blocks_to_show.append(num_blocks - int(num_blocks * i / 10) - 1)
-
-            # Add rows to the table
-            self.block_health_table.setRowCount(len(blocks_to_show))
+                    blocks_to_show.append(num_blocks - num_blocks * i // 10 - 1)
+
+            # Erase counts (would come from wear leveling engine); spread linearly between min and max
+            wear = device_info.get("statistics", {}).get("wear_leveling", {})
+            min_count = wear.get("min_erase_count", 0)
+            span = wear.get("max_erase_count", 0) - min_count
+            blocks_np = np.asarray(blocks_to_show, dtype=np.int64)
+            if num_blocks > 0:
+                erase_counts = (min_count + span * blocks_np // num_blocks).tolist()
+            else:
+                erase_counts = [0] * len(blocks_to_show)
+
+            # Bad block flags for the selected blocks; blocks outside the mask count as good
+            in_range = (blocks_np >= 0) & (blocks_np < len(bad_mask))
+            bad_flags = np.zeros(len(blocks_to_show), dtype=bool)
+            bad_flags[in_range] = bad_mask[blocks_np[in_range]]
+            bad_flags = bad_flags.tolist()
+
+            # Grow the pool of row items if needed; existing items are reused across refreshes
+            num_rows = len(blocks_to_show)
+            pool_size = len(self.block_health_items)
+            if num_rows > pool_size:
+                table.setRowCount(num_rows)
+                for row in range(pool_size, num_rows):
+                    row_items = tuple(QTableWidgetItem() for _ in range(5))
+                    row_items[4].setText("Unknown")  # Last operation
+                    for column, item in enumerate(row_items):
+                        table.setItem(row, column, item)
+                    self.block_health_items.append(row_items)
+
+            # Hide pooled rows beyond the current selection instead of deleting them
+            for row in range(min(num_rows, self.block_health_visible_rows), max(num_rows, self.block_health_visible_rows)):
+                table.setRowHidden(row, row >= num_rows)
+            self.block_health_visible_rows = num_rows
 
             for row, block in enumerate(blocks_to_show):
-                # Create items for the table
-                block_item = QTableWidgetItem(str(block))
+                block_item, status_item, erase_item, bad_item, _ = self.block_health_items[row]
 
-                # Determine block status
-                is_bad = False
-                try:
-                    is_bad = self.nand_controller.is_bad_block(block)
-                except:
-                    pass
+                is_bad = bad_flags[row]
 
-                status_item = QTableWidgetItem("Bad" if is_bad else "Good")
-                if is_bad:
-                    status_item.setForeground(QColor(255, 0, 0))  # Red color for bad blocks
-                else:
-                    status_item.setForeground(QColor(0, 128, 0))  # Green color for good blocks
+                block_item.setText(str(block))
 
-                # Erase count (would come from wear leveling engine)
-                erase_count = 0
-                try:
-                    # Get statistics
-                    stats = device_info.get("statistics", {})
-                    wear = stats.get("wear_leveling", {})
-                    min_count = wear.get("min_erase_count", 0)
-                    max_count = wear.get("max_erase_count", 0)
-
-                    # Generate a value between min and max
-                    erase_count = min_count + int((max_count - min_count) * (block / num_blocks))
-                except:
-                    pass
+                status_item.setText("Bad" if is_bad else "Good")
+                status_item.setForeground(BRUSH_RED if is_bad else BRUSH_GREEN)
 
-                erase_item = QTableWidgetItem(str(erase_count))
+                erase_item.setText(str(erase_counts[row]))
 
                 # Bad block flag
-                bad_item = QTableWidgetItem("Yes" if is_bad else "No")
+                bad_item.setText("Yes" if is_bad else "No")
                 if is_bad:
-                    bad_item.setForeground(QColor(255, 0, 0))
-
-                # Last operation
-                last_op = "Unknown"
-                last_op_item = QTableWidgetItem(last_op)
-
-                # Add items to the row
-                self.block_health_table.setItem(row, 0, block_item)
-                self.block_health_table.setItem(row, 1, status_item)
-                self.block_health_table.setItem(row, 2, erase_item)
-                self.block_health_table.setItem(row, 3, bad_item)
-                self.block_health_table.setItem(row, 4, last_op_item)
+                    bad_item.setForeground(BRUSH_RED)
+                else:
+                    bad_item.setData(Qt.ForegroundRole, None)
 
         except Exception as e:
             self.logger.error(f"Error updating block health table: {str(e)}")
             self.add_log_entry("ERROR", f"Error updating block health table: {str(e)}")
 
-    def add_log_entry(self, level, message):
-        """Add an entry to the log tree"""
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
-
-        # Create a tree widget item for the log entry
-        log_item = QTreeWidgetItem([timestamp, level, message])
-
-        # Set color based on level
-        if level == "ERROR" or level == "CRITICAL":
-            log_item.setForeground(2, QColor(255, 0, 0))  # Red for errors
-        elif level == "WARNING":
-            log_item.setForeground(2, QColor(255, 165, 0))  # Orange for warnings
-        elif level == "INFO":
-            log_item.setForeground(2, QColor(0, 0, 0))  # Black for info
-        elif level == "DEBUG":
-            log_item.setForeground(2, QColor(128, 128, 128))  # Gray for debug
+        finally:
+            table.blockSignals(False)
+            table.setSortingEnabled(sorting_enabled)
+            table.setUpdatesEnabled(True)
 
-        # Add item to tree
-        self.log_tree.insertTopLevelItem(0, log_item)  # Add at top for newest first
+    def add_log_entry(self, level, message):
+        """Add an entry to the log view"""
+        # Only re-format the timestamp when the second changes
+        now = int(time.time())
+        if now != self.last_log_second:
+            self.last_log_timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now))
+            self.last_log_second = now
+        timestamp = self.last_log_timestamp
+
+        # Queue the entry; bursts of entries reach the view in a single insert
+        self.pending_log_entries.append((timestamp, level, message))
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start()
+
+    def flush_log_entries(self):
+        """Show queued log entries in the log dock"""
+        if not self.pending_log_entries:
+            return
 
-        # Auto-scroll to the new item
-        self.log_tree.scrollToItem(log_item)
+        # Add entries at top for newest first; the proxy model applies the level filter
+        entries = self.pending_log_entries
+        self.pending_log_entries = []
+        self.log_model.add_entries(entries)
 
-        # Filter based on selected level
-        min_level = self.log_level_combo.currentText()
-        log_item.setHidden(not self.should_show_log_level(level, min_level))
+        # Auto-scroll to the newest entry
+        self.log_tree.scrollToTop()
 
     def should_show_log_level(self, level, min_level):
         """Determine if a log level should be shown based on minimum level"""
-        levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
-
-        if level not in levels or min_level not in levels:
-            return True
-
-        return levels.index(level) >= levels.index(min_level)
+        return should_show_log_level(level, min_level)
 
     def clear_logs(self):
         """Clear all log entries"""
-        self.log_tree.clear()
+        self.pending_log_entries = []
+        self.log_model.clear()
         self.add_log_entry("INFO", "Logs cleared")
 
     def open_file(self):
         """Open a file dialog to load data"""
         self.logger.info("Opening file dialog")
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getOpenFileName(self, "Open File", "", "All Files (*)")
+        file_path, _ = QFileDialog.getOpenFileName(self, "Open File", "", "All Files (*)")
 
         if file_path:
             self.logger.info(f"Loading data from {file_path}")
@@ -1038,8 +1617,7 @@ class MainWindow(QMainWindow):
     def save_file(self):
         """Open a file dialog to save data"""
         self.logger.info("Opening file save dialog")
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getSaveFileName(self, "Save File", "", "All Files (*)")
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save File", "", "All Files (*)")
 
         if file_path:
             self.logger.info(f"Saving data to {file_path}")
@@ -1071,12 +1649,10 @@ class MainWindow(QMainWindow):
             self.init_button.setText("NAND Controller Initialized")
             self.init_button.setEnabled(False)
             self.add_log_entry("INFO", "NAND controller initialization completed")
-            self.health_indicators["status"].setText("Status: Ready")
-            self.health_indicators["status"].setStyleSheet("color: green; font-weight: bold;")
+            self.set_label(self.health_indicators["status"], "Status: Ready", "good")
 
             # Update UI with initial data
-            self.update_statistics()
-            self.populate_block_page_combos()
+            self.full_refresh()
 
         elif operation_type == "load_data":
             file_path = result.get("file_path", "unknown")
@@ -1103,7 +1679,8 @@ class MainWindow(QMainWindow):
             else:
                 self.add_log_entry("WARNING", f"Test '{test_type}' failed: {details}")
 
-            # Update results viewer with test results
+            # Update results viewer with test results, superseding any deferred device info
+            self.pending_result = None
             self.result_viewer.update_results(result)
 
         # Reset progress UI
@@ -1164,7 +1741,16 @@ class MainWindow(QMainWindow):
         """Apply settings from the settings dialog"""
         # In a real implementation, this would get settings from the dialog
         # and apply them to the NAND controller
-        pass
+        self.refresh_reserved_blocks()
+        self.bad_block_cache = {}
+
+    def refresh_reserved_blocks(self):
+        """Cache the controller's reserved block numbers for quick membership checks"""
+        try:
+            self.reserved_block_set = frozenset(self.nand_controller.reserved_blocks.values())
+        except Exception as e:
+            self.logger.warning(f"Could not read reserved blocks: {str(e)}")
+            self.reserved_block_set = frozenset()
 
     def run_tests(self):
         """Run NAND tests"""
@@ -1207,9 +1793,9 @@ class MainWindow(QMainWindow):
         self.progress_bar.setVisible(True)
 
         try:
-            # Check if template.yaml exists
+            # Check if template.yaml exists (only until it has been found or created once)
             template_path = os.path.join("resources", "config", "template.yaml")
-            if not os.path.exists(template_path):
+            if not self.template_verified and not os.path.exists(template_path):
                 # Create the template file
                 try:
                     template_content = """---
@@ -1228,19 +1814,20 @@ class MainWindow(QMainWindow):
     wear_leveling_threshold: {{ wl_config.wear_leveling_threshold }}
     """
                     os.makedirs(os.path.dirname(template_path), exist_ok=True)
-                    with open(template_path, "w") as f:
-                        f.write(template_content)
+                    Path(template_path).write_text(template_content)
                     self.add_log_entry("INFO", f"Created template file: {template_path}")
                 except Exception as e:
                     self.add_log_entry("ERROR", f"Failed to create template file: {str(e)}")
                     raise RuntimeError(f"Missing template file and failed to create one: {str(e)}")
+            self.template_verified = True
 
             # Generate firmware specification
             self.progress_bar.setValue(30)
             firmware_spec = self.nand_controller.generate_firmware_spec()
             self.progress_bar.setValue(70)
 
-            # Show in result viewer
+            # Show in result viewer, superseding any deferred device info
+            self.pending_result = None
             self.result_viewer.update_results({"type": "firmware_spec", "spec": firmware_spec})
 
             # Switch to result viewer tab
@@ -1260,8 +1847,7 @@ class MainWindow(QMainWindow):
             )
 
             if reply == QMessageBox.Yes:
-                file_dialog = QFileDialog()
-                file_path, _ = file_dialog.getSaveFileName(self, "Save Firmware Specification", "firmware_spec.yaml", "YAML Files (*.yaml);;All Files (*)")
+                file_path, _ = QFileDialog.getSaveFileName(self, "Save Firmware Specification", "firmware_spec.yaml", "YAML Files (*.yaml);;All Files (*)")
 
                 if file_path:
                     try:
@@ -1317,20 +1903,18 @@ class MainWindow(QMainWindow):
         self.logger.info("Refreshing data")
         self.add_log_entry("INFO", "Refreshing data")
 
-        # Update statistics
-        self.update_statistics()
-
-        # Update block health table
-        self.update_block_health_table()
+        # Update statistics (this also refreshes the block health table)
+        self.schedule_statistics_update()
 
         # Show success message
         self.statusBar.showMessage("Data refreshed", 3000)
 
-    def populate_block_page_combos(self):
+    def populate_block_page_combos(self, device_info=None):
         """Populate the block and page combo boxes with better error handling"""
         try:
-            # Get device information
-            device_info = self.nand_controller.get_device_info()
+            # Get device information, unless a snapshot was provided
+            if device_info is None:
+                device_info = self.nand_controller.get_device_info()
             num_blocks = device_info.get("config", {}).get("user_blocks", 0)
             pages_per_block = device_info.get("config", {}).get("pages_per_block", 0)
 
@@ -1343,29 +1927,21 @@ class MainWindow(QMainWindow):
                 pages_per_block = 64  # Default fallback
                 self.logger.warning(f"Invalid pages per block ({pages_per_block}), using default")
 
-            # Clear existing items
-            self.read_block_combo.clear()
-            self.read_page_combo.clear()
-            self.write_block_combo.clear()
-            self.write_page_combo.clear()
-
-            # Add block numbers - add a reasonable number, not all blocks
+            # Build the list of good blocks - a reasonable number, not all blocks
             max_blocks_to_show = min(num_blocks, 100)
-            for i in range(max_blocks_to_show):
-                # Skip blocks that are known to be bad
-                try:
-                    if self.nand_controller.is_bad_block(i):
-                        continue
-                except:
-                    pass
+            if self.latest_stats is not None and len(self.latest_stats["bad_mask"]) >= max_blocks_to_show:
+                bad_mask = self.latest_stats["bad_mask"][:max_blocks_to_show]
+            else:
+                bad_mask = self.nand_controller.get_bad_block_mask()[:max_blocks_to_show]
 
-                self.read_block_combo.addItem(str(i))
-                self.write_block_combo.addItem(str(i))
+            # The lists are shared by the read and write combos; only reset them when their contents change
+            good_blocks = np.flatnonzero(~bad_mask).astype(str).tolist()
+            if good_blocks != self.block_model.stringList():
+                self.block_model.setStringList(good_blocks)
 
-            # Add page numbers
-            for i in range(pages_per_block):
-                self.read_page_combo.addItem(str(i))
-                self.write_page_combo.addItem(str(i))
+            # Page numbers only change with the geometry
+            if self.page_model.rowCount() != pages_per_block:
+                self.page_model.setStringList([str(i) for i in range(pages_per_block)])
 
             # Select reasonable defaults
             if self.read_block_combo.count() > 0:
@@ -1382,15 +1958,11 @@ class MainWindow(QMainWindow):
             self.add_log_entry("ERROR", f"Error populating block/page combos: {str(e)}")
 
             # Add at least some values as fallback
-            if self.read_block_combo.count() == 0:
-                for i in range(10):
-                    self.read_block_combo.addItem(str(i))
-                    self.write_block_combo.addItem(str(i))
+            if self.block_model.rowCount() == 0:
+                self.block_model.setStringList([str(i) for i in range(10)])
 
-            if self.read_page_combo.count() == 0:
-                for i in range(10):
-                    self.read_page_combo.addItem(str(i))
-                    self.write_page_combo.addItem(str(i))
+            if self.page_model.rowCount() == 0:
+                self.page_model.setStringList([str(i) for i in range(10)])
 
     def read_page(self):
         """Read a page from the NAND flash with enhanced error handling"""
@@ -1405,7 +1977,7 @@ class MainWindow(QMainWindow):
 
             # Check if block is bad before attempting to read
             try:
-                if self.nand_controller.is_bad_block(block):
+                if self.is_bad_block_cached(block):
                     self.add_log_entry("WARNING", f"Block {block} is marked as bad, read may fail")
 
                     # Ask user if they want to continue
@@ -1491,33 +2063,8 @@ class MainWindow(QMainWindow):
 
     def display_read_results(self, data):
         """Display read results in the table"""
-        # Clear the table
-        self.read_results_table.setRowCount(0)
-
-        if not data:
-            return
-
-        # Determine how many rows we need (16 bytes per row)
-        num_rows = (len(data) + 15) // 16
-        self.read_results_table.setRowCount(num_rows)
-
-        # Fill the table with data
-        for row in range(num_rows):
-            offset = row * 16
-
-            # Create offset item
-            offset_item = QTableWidgetItem(f"0x{offset:04X}")
-            self.read_results_table.setItem(row, 0, offset_item)
-
-            # Create data item (hex representation)
-            end = min(offset + 16, len(data))
-            hex_data = " ".join(f"{b:02X}" for b in data[offset:end])
-
-            # Add ASCII representation
-            ascii_data = "".join(chr(b) if 32 <= b <= 126 else "." for b in data[offset:end])
-
-            data_item = QTableWidgetItem(f"{hex_data}  |  {ascii_data}")
-            self.read_results_table.setItem(row, 1, data_item)
+        # Rows are formatted by the model as the view scrolls them into sight
+        self.read_results_model.set_bytes(data)
 
     def write_page(self):
         """Write a page to the NAND flash with enhanced error handling"""
@@ -1532,7 +2079,7 @@ class MainWindow(QMainWindow):
 
             # Check if block is bad before attempting to write
             try:
-                if self.nand_controller.is_bad_block(block):
+                if self.is_bad_block_cached(block):
                     self.add_log_entry("WARNING", f"Block {block} is marked as bad, write will fail")
                     QMessageBox.warning(self, "Bad Block", f"Block {block} is marked as bad. Please select a different block.")
                     return
@@ -1546,26 +2093,28 @@ class MainWindow(QMainWindow):
                 self.logger.info(f"Writing to page {page} in block {block}")
                 self.add_log_entry("INFO", f"Writing to page {page} in block {block}")
 
-                # Convert string to bytes
-                data_bytes = data.encode("utf-8")
-
-                # Check data size
+                # Check data size without encoding where possible: ASCII text is one byte per character, and
+                # other text only needs measuring when it could exceed the page at UTF-8's 4 bytes per character.
+                # The worker does the actual encoding and truncation
                 max_size = self.nand_controller.page_size
-                if len(data_bytes) > max_size:
-                    self.add_log_entry("WARNING", f"Data size ({len(data_bytes)} bytes) exceeds page size ({max_size} bytes)")
+                if data.isascii() or len(data) * 4 <= max_size:
+                    data_size = len(data)
+                else:
+                    data_size = len(data.encode("utf-8"))
+                if data_size > max_size:
+                    self.add_log_entry("WARNING", f"Data size ({data_size} bytes) exceeds page size ({max_size} bytes)")
 
                     # Ask user if they want to truncate the data
                     reply = QMessageBox.question(
                         self,
                         "Data Too Large",
-                        f"Data size ({len(data_bytes)} bytes) exceeds page size ({max_size} bytes). Truncate data?",
+                        f"Data size ({data_size} bytes) exceeds page size ({max_size} bytes). Truncate data?",
                         QMessageBox.Yes | QMessageBox.No,
                         QMessageBox.No,
                     )
 
                     if reply == QMessageBox.Yes:
-                        data_bytes = data_bytes[:max_size]
-                        self.add_log_entry("INFO", f"Data truncated to {len(data_bytes)} bytes")
+                        self.add_log_entry("INFO", f"Data truncated to {max_size} bytes")
                     else:
                         return
 
@@ -1574,7 +2123,7 @@ class MainWindow(QMainWindow):
                 self.progress_bar.setVisible(True)
                 self.progress_bar.setValue(0)
 
-                self.worker = OperationWorker(self.nand_controller, "write_page", block, page, data_bytes)
+                self.worker = OperationWorker(self.nand_controller, "write_page", block, page, data, max_size)
                 self.worker.progress_updated.connect(self.update_progress)
                 self.worker.operation_complete.connect(self.handle_write_complete)
                 self.worker.error_occurred.connect(self.handle_write_error)
@@ -1606,13 +2155,17 @@ class MainWindow(QMainWindow):
             # Update status bar
             self.statusBar.showMessage(f"Write to page {page} in block {block} successful", 5000)
 
-            # Refresh data displays
-            self.refresh_data()
+            # Refresh data displays; back-to-back operations share one coalesced update
+            self.schedule_statistics_update()
 
     def handle_write_error(self, error_message):
         """Handle failure of a write operation"""
         self.add_log_entry("ERROR", f"Write operation failed: {error_message}")
 
+        # A failed write may have retired the block; re-check bad blocks with the next snapshot
+        self.bad_block_cache = {}
+        self.schedule_statistics_update()
+
         # Show error message with recovery suggestions
         msg_box = QMessageBox(QMessageBox.Critical, "Write Failed", f"The write operation failed: {error_message}", parent=self)
 
@@ -1645,7 +2198,7 @@ class MainWindow(QMainWindow):
 
             # Check if block is bad before attempting to erase
             try:
-                if self.nand_controller.is_bad_block(block):
+                if self.is_bad_block_cached(block):
                     self.add_log_entry("WARNING", f"Block {block} is marked as bad, erase will fail")
                     QMessageBox.warning(self, "Bad Block", f"Block {block} is marked as bad. Please select a different block.")
                     return
@@ -1653,8 +2206,7 @@ class MainWindow(QMainWindow):
                 self.logger.warning(f"Could not check if block {block} is bad: {str(check_e)}")
 
             # Check if block is in reserved area
-            reserved_blocks = set(self.nand_controller.reserved_blocks.values())
-            if block in reserved_blocks:
+            if block in self.reserved_block_set:
                 self.add_log_entry("WARNING", f"Block {block} is a reserved system block")
 
                 # Ask user if they're sure
@@ -1718,16 +2270,20 @@ class MainWindow(QMainWindow):
             # Update status bar
             self.statusBar.showMessage(f"Block {block} erased successfully", 5000)
 
-            # Refresh data displays
-            self.refresh_data()
+            # Refresh data displays; back-to-back operations share one coalesced update
+            self.schedule_statistics_update()
 
     def handle_erase_error(self, error_message):
         """Handle failure of an erase operation"""
         self.add_log_entry("ERROR", f"Erase operation failed: {error_message}")
 
+        # A failed erase may have retired the block; re-check bad blocks with the next snapshot
+        self.bad_block_cache = {}
+        self.schedule_statistics_update()
+
         # Check if error message contains reference to a bad block
         if "bad block" in error_message.lower():
-            block_match = re.search(r"block (\d+)", error_message)
+            block_match = BLOCK_NUMBER_RE.search(error_message)
             if block_match:
                 block = int(block_match.group(1))
 
@@ -1743,6 +2299,7 @@ class MainWindow(QMainWindow):
                 if reply == QMessageBox.Yes:
                     try:
                         self.nand_controller.mark_bad_block(block)
+                        self.bad_block_cache[block] = True
                         self.add_log_entry("INFO", f"Block {block} marked as bad")
                     except Exception as e:
                         self.add_log_entry("ERROR", f"Failed to mark block {block} as bad: {str(e)}")
@@ -1769,48 +2326,40 @@ class MainWindow(QMainWindow):
 
     def load_batch_file(self):
         """Load a batch file with operations"""
+        if self.batch_running or (self.batch_loader is not None and self.batch_loader.isRunning()):
+            QMessageBox.information(self, "Batch Busy", "Wait for the current batch to finish before loading another")
+            return
+
         self.logger.info("Loading batch file")
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getOpenFileName(self, "Open Batch File", "", "JSON Files (*.json);;All Files (*)")
+        file_path, _ = QFileDialog.getOpenFileName(self, "Open Batch File", "", "JSON Files (*.json);;All Files (*)")
 
         if file_path:
-            try:
-                with open(file_path, "r") as f:
-                    batch_data = json.load(f)
-
-                # Clear the batch table
-                self.batch_table.setRowCount(0)
-
-                # Add operations to the table
-                if isinstance(batch_data, list):
-                    self.batch_table.setRowCount(len(batch_data))
-
-                    for row, op in enumerate(batch_data):
-                        op_type = op.get("type", "unknown")
-                        op_type_item = QTableWidgetItem(op_type)
-
-                        # Format parameters as string
-                        params = {}
-                        for key, value in op.items():
-                            if key != "type":
-                                params[key] = value
-                        params_item = QTableWidgetItem(str(params))
-
-                        status_item = QTableWidgetItem("Pending")
-
-                        self.batch_table.setItem(row, 0, op_type_item)
-                        self.batch_table.setItem(row, 1, params_item)
-                        self.batch_table.setItem(row, 2, status_item)
+            # Clear the batch table; rows are appended as the loader parses them
+            self.batch_model.clear()
+
+            self.batch_loader = BatchLoaderWorker(file_path)
+            self.batch_loader.rows_loaded.connect(self.append_batch_rows)
+            self.batch_loader.load_complete.connect(self.handle_batch_load_complete)
+            self.batch_loader.error_occurred.connect(self.handle_batch_load_error)
+            self.batch_loader.start()
+
+    def append_batch_rows(self, rows):
+        """Append a chunk of parsed batch operations to the batch table"""
+        # One row insertion per chunk; the view only formats the rows it shows
+        self.batch_model.append_operations(rows)
+
+    def handle_batch_load_complete(self, count):
+        """Handle a fully loaded batch file"""
+        self.add_log_entry("INFO", f"Loaded {count} operations from batch file")
+        self.statusBar.showMessage(f"Loaded {count} operations from batch file", 5000)
+
+    def handle_batch_load_error(self, error_message):
+        """Handle failure to load a batch file"""
+        self.logger.error(f"Error loading batch file: {error_message}")
+        self.add_log_entry("ERROR", f"Error loading batch file: {error_message}")
 
-                    self.add_log_entry("INFO", f"Loaded {len(batch_data)} operations from batch file")
-                    self.statusBar.showMessage(f"Loaded {len(batch_data)} operations from batch file", 5000)
-
-            except Exception as e:
-                self.logger.error(f"Error loading batch file: {str(e)}")
-                self.add_log_entry("ERROR", f"Error loading batch file: {str(e)}")
-
-                # Show error message
-                QMessageBox.critical(self, "Load Failed", f"Failed to load batch file: {str(e)}")
+        # Show error message
+        QMessageBox.critical(self, "Load Failed", f"Failed to load batch file: {error_message}")
 
     def run_batch(self):
         """Run the batch operations"""
@@ -1818,8 +2367,16 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Not Initialized", "NAND controller must be initialized first")
             return
 
+        if self.batch_running:
+            QMessageBox.information(self, "Batch Running", "Batch operations are already running")
+            return
+
+        if self.batch_loader is not None and self.batch_loader.isRunning():
+            QMessageBox.information(self, "Batch Loading", "The batch file is still loading")
+            return
+
         # Get number of operations
-        num_operations = self.batch_table.rowCount()
+        num_operations = self.batch_model.rowCount()
 
         if num_operations == 0:
             QMessageBox.information(self, "No Operations", "No batch operations to run")
@@ -1838,21 +2395,58 @@ class MainWindow(QMainWindow):
             self.logger.info(f"Running {num_operations} batch operations")
             self.add_log_entry("INFO", f"Running {num_operations} batch operations")
 
-            # In a real implementation, you would actually execute each operation
-            # For now, we'll just update the status
-            for row in range(num_operations):
-                # Update status to "Running"
-                status_item = QTableWidgetItem("Running")
-                self.batch_table.setItem(row, 2, status_item)
-                QApplication.processEvents()  # Update UI
-
-                time.sleep(0.5)  # Simulate work
+            # Group operations by block so that e.g. an erase and a later write to one block stay ordered
+            lanes = {}
+            for row, operation in enumerate(self.batch_model.operations):
+                block = operation.get("block") if isinstance(operation, dict) else None
+                lane_key = ("block", str(block)) if block is not None else ("row", row)
+                lanes.setdefault(lane_key, deque()).append(row)
+
+            self.batch_pending_lanes = deque(lanes.values())
+            self.batch_running = True
+
+            while self.batch_pending_lanes and len(self.batch_workers) < self.batch_max_workers:
+                self.run_next_batch_operation(self.batch_pending_lanes.popleft())
+
+    def run_next_batch_operation(self, lane):
+        """Start the next operation of a batch lane on a worker thread"""
+        row = lane.popleft()
+        self.batch_model.set_status(row, "Running")
+
+        worker = OperationWorker(self.nand_controller, "batch_operation", row, self.batch_model.operations[row])
+        worker.operation_complete.connect(self.handle_batch_operation_complete)
+        worker.error_occurred.connect(lambda message: self.handle_batch_operation_failed(row, message))
+        # Continue only once the thread has exited, so the finished worker can be released safely
+        worker.finished.connect(lambda: self.handle_batch_operation_finished(worker, lane))
+        self.batch_workers.add(worker)
+        worker.start()
+
+    def handle_batch_operation_complete(self, result):
+        """Mark a batch operation as completed"""
+        self.batch_model.set_status(result["row"], "Completed")
+
+    def handle_batch_operation_failed(self, row, error_message):
+        """Mark a batch operation as failed; the remaining operations still run"""
+        self.batch_model.set_status(row, "Failed")
+        self.add_log_entry("ERROR", f"Batch operation {row + 1} failed: {error_message}")
+
+    def handle_batch_operation_finished(self, worker, lane):
+        """Release a finished worker and start the next operation of its lane, or of a pending lane"""
+        # finished is emitted just before the thread exits; make sure it has before dropping the last reference
+        worker.wait()
+        self.batch_workers.discard(worker)
+
+        if not self.batch_running:
+            return
 
-                # Update status to "Completed"
-                status_item = QTableWidgetItem("Completed")
-                self.batch_table.setItem(row, 2, status_item)
-                QApplication.processEvents()  # Update UI
+        if not lane and self.batch_pending_lanes:
+            lane = self.batch_pending_lanes.popleft()
 
+        if lane:
+            self.run_next_batch_operation(lane)
+        elif not self.batch_workers:
+            self.batch_running = False
+            self.schedule_statistics_update()
             self.add_log_entry("INFO", "Batch operations completed")
             self.statusBar.showMessage("Batch operations completed", 5000)
 
@@ -1876,6 +2470,19 @@ class MainWindow(QMainWindow):
             # Try to cancel the operation
             self.worker.cancel()
 
+        # Stop periodic refreshes and let a running statistics collection finish
+        self.update_timer.stop()
+        self.refresh_timer.stop()
+        if self.stats_worker is not None:
+            self.stats_worker.wait()
+
+        # Stop the batch after the operations already running
+        if self.batch_loader is not None:
+            self.batch_loader.wait()
+        self.batch_running = False
+        for batch_worker in list(self.batch_workers):
+            batch_worker.wait()
+
         # Shut down the NAND controller
         if self.is_initialized:
             try:
@@ -1,10 +1,13 @@
 # src/ui/result_viewer.py
 
+import gzip
 import json
+import pprint
 
 import matplotlib
 import yaml
-from PyQt5.QtGui import QColor, QFont
+from PyQt5.QtCore import QThread, QTimer, pyqtSignal
+from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -13,27 +16,52 @@ from PyQt5.QtWidgets import (
     QHeaderView,
     QLabel,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QTabWidget,
     QTextBrowser,
-    QTextEdit,
     QTreeWidget,
     QTreeWidgetItem,
     QVBoxLayout,
     QWidget,
 )
 
+from src.ui.brushes import BRUSH_GREEN, BRUSH_RED
+from src.utils.config import YAML_DUMPER, YAML_LOADER
 from src.utils.logger import get_logger
 
 matplotlib.use("Qt5Agg")
+import matplotlib.style as mplstyle
+
+# Simplify paths and chunk large Agg draws (path.simplify, simplify_threshold=1.0, agg.path.chunksize=10000)
+mplstyle.use("fast")
+
 import numpy as np
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
+from matplotlib.patches import Patch
+
+# Optional faster JSON encoder for the raw data view; json is used when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Status values highlighted in the details tree
+GOOD_STATUS_VALUES = frozenset(["good", "ready", "passed", "true"])
+BAD_STATUS_VALUES = frozenset(["bad", "error", "failed", "false"])
+
+# Generator for synthetic wear distributions; faster than the legacy global RandomState
+RNG = np.random.default_rng()
 
 
 class ResultVisualizer(FigureCanvas):
     """Enhanced canvas for visualizing various result data"""
 
+    # Block ranges larger than this are drawn as binned bad block counts rather than one bar per block
+    BAD_BLOCK_BIN_THRESHOLD = 4096
+    BAD_BLOCK_BINS = 2000
+
     def __init__(self, parent=None, width=6, height=4, dpi=100):
         self.fig = Figure(figsize=(width, height), dpi=dpi)
         self.axes = self.fig.add_subplot(111)
@@ -46,98 +74,176 @@ class ResultVisualizer(FigureCanvas):
         self.axes.set_title("No Data Available")
         self.axes.set_facecolor("#f8f9fa")
 
-        # Use subplots_adjust instead of tight_layout
+        # Fixed margins set once for every plot, instead of solving tight_layout on each render
         self.fig.subplots_adjust(bottom=0.15, left=0.15, top=0.9, right=0.95)
 
-    def plot_bad_block_distribution(self, bad_blocks):
-        """Plot the distribution of bad blocks with improved visualization"""
+        # Layout of the last plot and the artists that can be updated in place for the same layout
+        self.plot_key = None
+        self.plot_artists = {}
+
+        # Animated artists are left out of full renders and blitted over this cached background
+        self.animated_artists = []
+        self.blit_background = None
+        self.mpl_connect("draw_event", self.handle_draw_event)
+
+    def clear_plot(self):
+        """Clear the axes and forget the artists of the previous plot"""
         self.axes.clear()
+        self.plot_key = None
+        self.plot_artists = {}
+        self.animated_artists = []
+        self.blit_background = None
+
+    def set_animated_artists(self, artists):
+        """Mark artists that in-place updates redraw by blitting"""
+        for artist in artists:
+            artist.set_animated(True)
+        self.animated_artists = list(artists)
+
+    def handle_draw_event(self, event):
+        """Cache the static background of a full render, then draw the animated artists over it"""
+        if not self.animated_artists:
+            return
+        self.blit_background = self.copy_from_bbox(self.fig.bbox)
+        for artist in self.animated_artists:
+            self.fig.draw_artist(artist)
+
+    def blit_animated_artists(self):
+        """Redraw only the animated artists over the cached background"""
+        if self.blit_background is None:
+            # Not rendered since the plot was built, so there is no background yet
+            self.draw_idle()
+            return
+        self.restore_region(self.blit_background)
+        for artist in self.animated_artists:
+            self.fig.draw_artist(artist)
+        self.blit(self.fig.bbox)
+
+    def draw_message(self, message):
+        """Show a message in the middle of the axes in place of a plot"""
+        self.axes.text(
+            0.5,
+            0.5,
+            message,
+            transform=self.axes.transAxes,
+            fontsize=12,
+            horizontalalignment="center",
+            verticalalignment="center",
+        )
+
+    def plot_bad_block_distribution(self, bad_blocks):
+        """Plot the distribution of bad blocks, given as a list or NumPy array of block numbers"""
+        if isinstance(bad_blocks, np.ndarray):
+            block_numbers = bad_blocks.astype(np.int64, copy=False)
+        elif isinstance(bad_blocks, list) and bad_blocks:
+            block_numbers = np.fromiter(bad_blocks, dtype=np.int64, count=len(bad_blocks))
+        else:
+            block_numbers = None
+
+        if block_numbers is None or len(block_numbers) == 0:
+            # Healthy device or no data; nothing to lay out beyond the message
+            self.clear_plot()
+            self.axes.set_title("Bad Block Distribution")
+            self.draw_message("No bad blocks found")
+            self.draw_idle()
+            return
+
+        max_block = int(block_numbers.max())
+        # Each bad block is drawn and counted once, however often it is listed
+        bad_block_numbers = np.unique(block_numbers[block_numbers >= 0])
+        if self.plot_key == ("bad_block_bins", max_block):
+            # Same binned layout as the last plot, so only the bar heights change
+            counts, _ = self.bin_bad_blocks(bad_block_numbers, max_block)
+            self.update_bad_block_bins(counts, len(bad_block_numbers))
+            return
+
+        self.clear_plot()
 
         # Set up the plot
         self.axes.set_title("Bad Block Distribution")
         self.axes.set_xlabel("Block Number")
         self.axes.set_ylabel("Status")
 
-        # Plot each bad block as a vertical line
-        if isinstance(bad_blocks, list) and bad_blocks:
-            # Get the range of blocks
-            if len(bad_blocks) > 0:
-                max_block = max(bad_blocks)
-
-                # Create a base array of good blocks (zeros)
-                all_blocks = np.zeros(max_block + 1)
-
-                # Mark bad blocks (set to 1)
-                for block in bad_blocks:
-                    if 0 <= block < len(all_blocks):
-                        all_blocks[block] = 1
-
-                # Create a more visible representation
-                # Use bar chart with color coding
-                self.axes.bar(
-                    range(len(all_blocks)),
-                    all_blocks,
-                    color=["red" if x > 0 else "green" for x in all_blocks],
-                    alpha=0.7,
-                    width=1.0,
-                )
-
-                # Set y-axis limits
-                self.axes.set_ylim(0, 1.2)
-
-                # Add legend
-                from matplotlib.patches import Patch
-
-                legend_elements = [
-                    Patch(facecolor="green", alpha=0.7, label="Good Block"),
-                    Patch(facecolor="red", alpha=0.7, label="Bad Block"),
-                ]
-                self.axes.legend(handles=legend_elements, loc="upper right")
-
-                # Add text with count
-                self.axes.text(
-                    0.05,
-                    0.95,
-                    f"Bad Blocks: {len(bad_blocks)}",
-                    transform=self.axes.transAxes,
-                    fontsize=12,
-                    verticalalignment="top",
-                    bbox=dict(boxstyle="round", facecolor="white", alpha=0.8),
-                )
-            else:
-                # No bad blocks, show empty plot
-                self.axes.text(
-                    0.5,
-                    0.5,
-                    "No bad blocks found",
-                    transform=self.axes.transAxes,
-                    fontsize=12,
-                    horizontalalignment="center",
-                    verticalalignment="center",
-                )
+        # Draw only the bad blocks; good blocks are a single band along the axis
+        if max_block + 1 > self.BAD_BLOCK_BIN_THRESHOLD:
+            # Too many blocks for one bar each, so show how many bad blocks fall in each bin
+            counts, edges = self.bin_bad_blocks(bad_block_numbers, max_block)
+            # One step patch for all bins rather than a Rectangle artist per bin
+            bars = self.axes.stairs(counts, edges, fill=True, color="red", alpha=0.7)
+            self.axes.set_ylabel("Bad Blocks per Bin")
+            y_max = max(int(counts.max()), 1)
+            self.plot_key = ("bad_block_bins", max_block)
+            self.plot_artists["bars"] = bars
         else:
-            # No bad blocks, show empty plot
-            self.axes.text(
-                0.5,
-                0.5,
-                "No bad blocks found",
-                transform=self.axes.transAxes,
-                fontsize=12,
-                horizontalalignment="center",
-                verticalalignment="center",
-            )
+            # One collection of unit-wide spans centred on the bad blocks
+            spans = np.column_stack((bad_block_numbers - 0.5, np.ones(len(bad_block_numbers))))
+            self.axes.broken_barh(spans, (0, 1), facecolors="red", alpha=0.7)
+            y_max = 1
+        self.plot_artists["good_band"] = self.axes.axhspan(0, 0.02 * y_max, color="green", alpha=0.7)
+
+        # Set y-axis limits
+        self.axes.set_ylim(0, 1.2 * y_max)
+
+        # Add legend
+        legend_elements = [
+            Patch(facecolor="green", alpha=0.7, label="Good Block"),
+            Patch(facecolor="red", alpha=0.7, label="Bad Block"),
+        ]
+        legend = self.axes.legend(handles=legend_elements, loc="upper right")
+
+        # Add text with count
+        self.plot_artists["count_text"] = self.axes.text(
+            0.05,
+            0.95,
+            f"Bad Blocks: {len(bad_block_numbers)}",
+            transform=self.axes.transAxes,
+            fontsize=12,
+            verticalalignment="top",
+            bbox=dict(boxstyle="round", facecolor="white", alpha=0.8),
+        )
+
+        if self.plot_key is not None:
+            # Binned bars and the count change in place, so they are blitted over the static axes
+            self.plot_artists["y_max"] = y_max
+            self.set_animated_artists([self.plot_artists["bars"], legend, self.plot_artists["count_text"]])
 
         # Set x-axis limits with a small margin
-        if len(bad_blocks) > 0:
-            self.axes.set_xlim(-max_block * 0.02, max_block * 1.02)
+        self.axes.set_xlim(-max_block * 0.02, max_block * 1.02)
 
-        # Update the figure
-        self.fig.subplots_adjust(bottom=0.15, left=0.15, top=0.9, right=0.95)
-        self.draw()
+        # Update the figure; the render is deferred so back-to-back updates draw once
+        self.draw_idle()
+
+    def bin_bad_blocks(self, bad_block_numbers, max_block):
+        """Count the unique bad block numbers falling in each bin of the binned layout"""
+        return np.histogram(bad_block_numbers, bins=self.BAD_BLOCK_BINS, range=(0, max_block + 1))
+
+    def update_bad_block_bins(self, counts, bad_block_count):
+        """Update the binned bad block bars of the current plot in place"""
+        self.plot_artists["bars"].set_data(counts)
+        self.plot_artists["count_text"].set_text(f"Bad Blocks: {bad_block_count}")
+
+        y_max = max(int(counts.max()), 1)
+        if y_max == self.plot_artists["y_max"]:
+            # Same y-axis, so the static background is still valid
+            self.blit_animated_artists()
+            return
+
+        # Rescale the good block band and the y-axis to the new bin counts
+        self.plot_artists["y_max"] = y_max
+        self.plot_artists["good_band"].remove()
+        self.plot_artists["good_band"] = self.axes.axhspan(0, 0.02 * y_max, color="green", alpha=0.7)
+        self.axes.set_ylim(0, 1.2 * y_max)
+        self.draw_idle()
 
     def plot_wear_leveling(self, wear_data):
         """Plot wear leveling distribution"""
-        self.axes.clear()
+        histogram = wear_data.get("histogram") if isinstance(wear_data, dict) else None
+        if histogram is not None and self.plot_key == ("wear_histogram", tuple(histogram[1])):
+            # Same bin edges as the last plot, so only the counts and markers change
+            self.update_wear_histogram(wear_data)
+            return
+
+        self.clear_plot()
 
         # Set up the plot
         self.axes.set_title("Wear Leveling Distribution")
@@ -145,43 +251,63 @@ class ResultVisualizer(FigureCanvas):
         self.axes.set_ylabel("Frequency")
 
         if isinstance(wear_data, dict) and wear_data:
-            # Calculate histogram data
-            min_val = wear_data.get("min", 0)
-            max_val = wear_data.get("max", 1000)
-            avg_val = wear_data.get("mean", 500)
-
-            # Generate some synthetic data for visualization
-            # In a real implementation, you would use actual erase count data
-            data = np.random.normal(avg_val, (max_val - min_val) / 6, 1000)
-            data = np.clip(data, min_val, max_val)
-
-            # Plot histogram
-            self.axes.hist(data, bins=30, alpha=0.7, color="blue")
+            min_val, max_val, avg_val = self.wear_markers(wear_data)
+
+            # Plot the erase count distribution from the data we were given
+            if histogram is not None:
+                counts, edges = histogram
+                self.plot_key = ("wear_histogram", tuple(edges))
+                self.plot_artists["stairs"] = self.axes.stairs(counts, edges, fill=True, alpha=0.7, color="blue")
+            elif wear_data.get("raw") is not None:
+                self.axes.hist(wear_data["raw"], bins=30, alpha=0.7, color="blue")
+            elif wear_data.get("distribution"):
+                self.axes.hist(list(wear_data["distribution"].values()), bins=30, alpha=0.7, color="blue")
 
             # Add vertical lines for min, max, avg
-            self.axes.axvline(x=min_val, color="g", linestyle="--", label=f"Min: {min_val}")
-            self.axes.axvline(x=max_val, color="r", linestyle="--", label=f"Max: {max_val}")
-            self.axes.axvline(x=avg_val, color="k", linestyle="-", label=f"Avg: {avg_val:.1f}")
+            self.plot_artists["markers"] = [
+                self.axes.axvline(x=min_val, color="g", linestyle="--", label=f"Min: {min_val}"),
+                self.axes.axvline(x=max_val, color="r", linestyle="--", label=f"Max: {max_val}"),
+                self.axes.axvline(x=avg_val, color="k", linestyle="-", label=f"Avg: {avg_val:.1f}"),
+            ]
 
             self.axes.legend()
         else:
             # No wear data, show empty plot
-            self.axes.text(
-                0.5,
-                0.5,
-                "No wear leveling data available",
-                transform=self.axes.transAxes,
-                fontsize=12,
-                horizontalalignment="center",
-                verticalalignment="center",
-            )
-
-        self.fig.tight_layout()
-        self.draw()
+            self.draw_message("No wear leveling data available")
+
+        self.draw_idle()
+
+    def wear_markers(self, wear_data):
+        """Return the min, max and average erase counts of the wear data"""
+        return (
+            wear_data.get("min", wear_data.get("min_erase_count", 0)),
+            wear_data.get("max", wear_data.get("max_erase_count", 0)),
+            wear_data.get("mean", wear_data.get("avg_erase_count", 0)),
+        )
+
+    def update_wear_histogram(self, wear_data):
+        """Update the wear histogram and its markers of the current plot in place"""
+        counts, _ = wear_data["histogram"]
+        self.plot_artists["stairs"].set_data(counts)
+
+        min_line, max_line, avg_line = self.plot_artists["markers"]
+        min_val, max_val, avg_val = self.wear_markers(wear_data)
+        min_line.set_xdata([min_val, min_val])
+        min_line.set_label(f"Min: {min_val}")
+        max_line.set_xdata([max_val, max_val])
+        max_line.set_label(f"Max: {max_val}")
+        avg_line.set_xdata([avg_val, avg_val])
+        avg_line.set_label(f"Avg: {avg_val:.1f}")
+
+        # Refresh the legend labels and the y-axis range for the new counts
+        self.axes.legend()
+        self.axes.relim()
+        self.axes.autoscale_view()
+        self.draw_idle()
 
     def plot_test_results(self, test_results):
         """Plot test results"""
-        self.axes.clear()
+        self.clear_plot()
 
         # Set up the plot
         self.axes.set_title("Test Results")
@@ -212,43 +338,25 @@ class ResultVisualizer(FigureCanvas):
                 colors.append("red")
 
             if labels and values:
-                self.axes.bar(labels, values, color=colors)
+                bars = self.axes.bar(labels, values, color=colors)
 
-                # Add percentages
-                for i, v in enumerate(values):
-                    self.axes.text(i, v + 0.5, f"{v}", ha="center")
+                # Label each bar with its count
+                self.axes.bar_label(bars, padding=3)
 
                 # Add title with test type
                 self.axes.set_title(f"Test Results: {test_type}")
             else:
                 # No specific test data, show a simple text
-                self.axes.text(
-                    0.5,
-                    0.5,
-                    f"Test completed: {test_type}",
-                    transform=self.axes.transAxes,
-                    fontsize=12,
-                    horizontalalignment="center",
-                    verticalalignment="center",
-                )
+                self.draw_message(f"Test completed: {test_type}")
         else:
             # No test data, show empty plot
-            self.axes.text(
-                0.5,
-                0.5,
-                "No test results available",
-                transform=self.axes.transAxes,
-                fontsize=12,
-                horizontalalignment="center",
-                verticalalignment="center",
-            )
-
-        self.fig.tight_layout()
-        self.draw()
+            self.draw_message("No test results available")
+
+        self.draw_idle()
 
     def plot_performance(self, performance_data):
         """Plot performance metrics"""
-        self.axes.clear()
+        self.clear_plot()
 
         # Set up the plot
         self.axes.set_title("Performance Metrics")
@@ -266,39 +374,68 @@ class ResultVisualizer(FigureCanvas):
             if metrics and values:
                 # Create horizontal bar chart
                 y_pos = np.arange(len(metrics))
-                self.axes.barh(y_pos, values, align="center")
+                bars = self.axes.barh(y_pos, values, align="center")
                 self.axes.set_yticks(y_pos)
                 self.axes.set_yticklabels(metrics)
                 self.axes.invert_yaxis()  # Labels read top-to-bottom
 
                 # Add values as text
-                for i, v in enumerate(values):
-                    self.axes.text(v + 0.1, i, f"{v:.2f}", va="center")
+                self.axes.bar_label(bars, fmt="%.2f", padding=3)
             else:
                 # No specific metrics, show a simple text
-                self.axes.text(
-                    0.5,
-                    0.5,
-                    "Performance data available but no metrics to plot",
-                    transform=self.axes.transAxes,
-                    fontsize=12,
-                    horizontalalignment="center",
-                    verticalalignment="center",
-                )
+                self.draw_message("Performance data available but no metrics to plot")
         else:
             # No performance data, show empty plot
-            self.axes.text(
-                0.5,
-                0.5,
-                "No performance metrics available",
-                transform=self.axes.transAxes,
-                fontsize=12,
-                horizontalalignment="center",
-                verticalalignment="center",
-            )
+            self.draw_message("No performance metrics available")
+
+        self.draw_idle()
+
 
-        self.fig.tight_layout()
-        self.draw()
+class RawDataWorker(QThread):
+    """Worker thread to serialize results for the raw data tab without freezing the UI"""
+
+    text_ready = pyqtSignal(str)
+    error_occurred = pyqtSignal(str)
+
+    # Line width for pretty-printed text output
+    TEXT_WIDTH = 120
+
+    def __init__(self, results, format_type, pretty):
+        super().__init__()
+        self.results = results
+        self.format_type = format_type
+        self.pretty = pretty
+
+    def run(self):
+        try:
+            self.text_ready.emit(self.format_results(self.results, self.format_type, self.pretty))
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+    @staticmethod
+    def format_results(results, format_type, pretty=True):
+        """Serialize results as JSON, YAML or plain text"""
+        if format_type == "JSON":
+            return RawDataWorker.dump_json(results, pretty)
+        if format_type == "YAML":
+            return yaml.dump(results, Dumper=YAML_DUMPER, default_flow_style=not pretty)
+        if pretty:
+            return pprint.pformat(results, compact=True, width=RawDataWorker.TEXT_WIDTH)
+        return str(results)
+
+    @staticmethod
+    def dump_json(data, pretty=True):
+        """Serialize results to JSON, preferring orjson when it is installed"""
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            if pretty:
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(data, option=option).decode("utf-8")
+            except TypeError:
+                pass  # Let json report types orjson cannot encode
+
+        return json.dumps(data, indent=2 if pretty else None)
 
 
 class ResultViewer(QWidget):
@@ -307,10 +444,53 @@ class ResultViewer(QWidget):
     Provides visualization, analysis, and export functionality
     """
 
+    # Milliseconds to wait for further control changes before replotting or reformatting
+    CONTROL_DEBOUNCE_INTERVAL = 50
+
+    # Characters of serialized results shown in the raw data tab; laying out more stalls the UI
+    RAW_DATA_DISPLAY_LIMIT = 200_000
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = get_logger(__name__)
         self.current_results = None
+
+        # Background serialization for the raw data tab
+        self.raw_data_worker = None
+        self.raw_data_update_pending = False
+
+        # Serialized raw data text by (format, pretty) for the current results, and the one on display
+        self.raw_data_cache = {}
+        self.raw_data_shown = None
+
+        # Visualization type plotted from the current results
+        self.visualization_shown = None
+
+        # Plotting method for each visualization type, given the results' statistics
+        self.visualization_handlers = {
+            "Bad Block Distribution": self.visualize_bad_blocks,
+            "Wear Leveling": self.visualize_wear_leveling,
+            "Test Results": self.visualize_test_results,
+            "Performance Metrics": self.visualize_performance,
+        }
+
+        # Coalesce bursts of visualization and raw data format changes into a single update
+        self.visualization_timer = QTimer(self)
+        self.visualization_timer.setSingleShot(True)
+        self.visualization_timer.setInterval(self.CONTROL_DEBOUNCE_INTERVAL)
+        self.visualization_timer.timeout.connect(self.handle_visualization_type_changed)
+        self.raw_data_format_timer = QTimer(self)
+        self.raw_data_format_timer.setSingleShot(True)
+        self.raw_data_format_timer.setInterval(self.CONTROL_DEBOUNCE_INTERVAL)
+        self.raw_data_format_timer.timeout.connect(self.update_raw_data_format)
+
+        # Results the displayed summary was built from; holding the object keeps its identity unique
+        self.summary_results = None
+
+        # Last firmware spec text parsed for the summary, and its parsed form
+        self.parsed_spec_text = None
+        self.parsed_spec = None
+
         self.init_ui()
 
     def init_ui(self):
@@ -338,6 +518,16 @@ class ResultViewer(QWidget):
         self.result_tabs.addTab(self.visualization_tab, "Visualization")
         self.result_tabs.addTab(self.raw_data_tab, "Raw Data")
 
+        # Tabs whose content is stale, rebuilt when they become current
+        self.tab_renderers = {
+            self.summary_tab: self.render_summary,
+            self.details_tab: self.render_details,
+            self.visualization_tab: self.render_visualization,
+            self.raw_data_tab: self.render_raw_data,
+        }
+        self.dirty_tabs = set()
+        self.result_tabs.currentChanged.connect(self.render_current_tab)
+
         main_layout.addWidget(self.result_tabs)
 
         # Add controls at the bottom
@@ -351,7 +541,7 @@ class ResultViewer(QWidget):
 
         self.visualization_type = QComboBox()
         self.visualization_type.addItems(["Bad Block Distribution", "Wear Leveling", "Test Results", "Performance Metrics"])
-        self.visualization_type.currentTextChanged.connect(self.update_visualization)
+        self.visualization_type.currentTextChanged.connect(lambda: self.visualization_timer.start())
 
         controls_layout.addWidget(QLabel("Visualization:"))
         controls_layout.addWidget(self.visualization_type)
@@ -419,8 +609,8 @@ class ResultViewer(QWidget):
         tab = QWidget()
         layout = QVBoxLayout(tab)
 
-        # Create text editor for raw data
-        self.raw_data_text = QTextEdit()
+        # Create plain text view for raw data; it is never rich text, so skip QTextEdit's document layout
+        self.raw_data_text = QPlainTextEdit()
         self.raw_data_text.setReadOnly(True)
         self.raw_data_text.setFont(QFont("Courier New", 10))
 
@@ -430,11 +620,11 @@ class ResultViewer(QWidget):
 
         self.format_combo = QComboBox()
         self.format_combo.addItems(["JSON", "YAML", "Text"])
-        self.format_combo.currentTextChanged.connect(self.update_raw_data_format)
+        self.format_combo.currentTextChanged.connect(lambda: self.raw_data_format_timer.start())
 
         self.pretty_print = QCheckBox("Pretty Print")
         self.pretty_print.setChecked(True)
-        self.pretty_print.toggled.connect(self.update_raw_data_format)
+        self.pretty_print.toggled.connect(lambda: self.raw_data_format_timer.start())
 
         format_layout.addWidget(self.format_combo)
         format_layout.addWidget(self.pretty_print)
@@ -453,56 +643,87 @@ class ResultViewer(QWidget):
         try:
             # Store the results for future use
             self.current_results = results
+            self.raw_data_cache = {}
+            self.raw_data_shown = None
+            self.visualization_shown = None
 
-            # Update summary tab
-            try:
-                self.update_summary()
-            except Exception as e:
-                self.logger.error(f"Error updating summary tab: {str(e)}")
-                # Fallback to a simple display
-                self.summary_text.setHtml(f"<h2>NAND Optimization Results</h2><p>Error displaying summary: {str(e)}</p>")
-
-            # Update details tab
-            try:
-                self.update_details()
-            except Exception as e:
-                self.logger.error(f"Error updating details tab: {str(e)}")
-                # Clear the tree
-                self.details_tree.clear()
-                # Add an error item
-                error_item = QTreeWidgetItem(self.details_tree, ["Error", str(e)])
-                error_item.setForeground(1, QColor(255, 0, 0))
-
-            # Update visualization tab
-            try:
-                self.update_visualization()
-            except Exception as e:
-                self.logger.error(f"Error updating visualization tab: {str(e)}")
-                # Show error message in the visualization
-                self.result_visualizer.axes.clear()
-                self.result_visualizer.axes.text(0.5, 0.5, f"Error creating visualization: {str(e)}", ha="center", va="center", fontsize=12, color="red")
-                self.result_visualizer.fig.canvas.draw()
-
-            # Update raw data tab
-            try:
-                self.update_raw_data()
-            except Exception as e:
-                self.logger.error(f"Error updating raw data tab: {str(e)}")
-                # Fallback to a simple display
-                self.raw_data_text.setText(f"Error displaying raw data: {str(e)}\n\nRaw results:\n{str(results)}")
+            # Tabs are rebuilt lazily, when they are next shown
+            self.dirty_tabs = set(self.tab_renderers)
+            self.render_current_tab()
 
         except Exception as e:
             self.logger.error(f"Critical error updating results: {str(e)}")
             self.summary_text.setHtml(f"<h2>Error Displaying Results</h2><p>A critical error occurred: {str(e)}</p>")
 
+    def render_current_tab(self, index=None):
+        """Rebuild the visible result tab if it is out of date"""
+        tab = self.result_tabs.currentWidget()
+        if tab in self.dirty_tabs:
+            self.dirty_tabs.discard(tab)
+            self.tab_renderers[tab]()
+
+    def handle_visualization_type_changed(self):
+        """Replot for the new visualization type, or defer it until the tab is shown"""
+        if self.result_tabs.currentWidget() is self.visualization_tab:
+            self.render_visualization()
+        else:
+            self.dirty_tabs.add(self.visualization_tab)
+
+    def render_summary(self):
+        """Update the summary tab, falling back to an error message"""
+        try:
+            self.update_summary()
+        except Exception as e:
+            self.logger.error(f"Error updating summary tab: {str(e)}")
+            # Fallback to a simple display
+            self.summary_text.setHtml(f"<h2>NAND Optimization Results</h2><p>Error displaying summary: {str(e)}</p>")
+
+    def render_details(self):
+        """Update the details tab, falling back to an error item"""
+        try:
+            self.update_details()
+        except Exception as e:
+            self.logger.error(f"Error updating details tab: {str(e)}")
+            # Clear the tree
+            self.details_tree.clear()
+            # Add an error item
+            error_item = QTreeWidgetItem(self.details_tree, ["Error", str(e)])
+            error_item.setForeground(1, BRUSH_RED)
+
+    def render_visualization(self):
+        """Update the visualization tab, falling back to an error message"""
+        try:
+            self.update_visualization()
+        except Exception as e:
+            self.logger.error(f"Error updating visualization tab: {str(e)}")
+            self.visualization_shown = None
+            # Show error message in the visualization
+            self.result_visualizer.clear_plot()
+            self.result_visualizer.axes.text(0.5, 0.5, f"Error creating visualization: {str(e)}", ha="center", va="center", fontsize=12, color="red")
+            self.result_visualizer.draw_idle()
+
+    def render_raw_data(self):
+        """Update the raw data tab, falling back to the plain repr"""
+        try:
+            self.update_raw_data()
+        except Exception as e:
+            self.logger.error(f"Error updating raw data tab: {str(e)}")
+            self.raw_data_shown = None
+            # Fallback to a simple display
+            self.raw_data_text.setPlainText(f"Error displaying raw data: {str(e)}\n\nRaw results:\n{str(self.current_results)}")
+
     def update_summary(self):
         """Update the summary tab with current results, with improved formatting and error handling"""
         if not self.current_results:
             self.summary_text.setHtml("<h2>NAND Optimization Results Summary</h2><p>No results available yet.</p>")
             return
 
+        # The summary on display was already built from these results
+        if self.current_results is self.summary_results:
+            return
+
         # Create HTML summary based on result type
-        html = "<h2>NAND Optimization Results Summary</h2>"
+        parts = ["<h2>NAND Optimization Results Summary</h2>"]
 
         result_type = self.current_results.get("type", "")
 
@@ -510,188 +731,183 @@ class ResultViewer(QWidget):
             # Firmware specification summary
             spec = self.current_results.get("spec", "")
             if spec:
-                html += "<h3>Firmware Specification Generated</h3>"
-                html += "<p>A firmware specification has been successfully generated.</p>"
+                parts.append("<h3>Firmware Specification Generated</h3>")
+                parts.append("<p>A firmware specification has been successfully generated.</p>")
 
                 # Try to parse YAML for nicer display
                 try:
-                    spec_data = yaml.safe_load(spec)
+                    spec_data = self.parse_spec(spec)
                     if isinstance(spec_data, dict):
                         # Add firmware version
                         if "firmware_version" in spec_data:
-                            html += f"<p><strong>Firmware Version:</strong> {spec_data['firmware_version']}</p>"
+                            parts.append(f"<p><strong>Firmware Version:</strong> {spec_data['firmware_version']}</p>")
 
                         # Add NAND config summary
                         if "nand_config" in spec_data:
                             nand_config = spec_data["nand_config"]
-                            html += "<h4>NAND Configuration</h4>"
-                            html += "<ul>"
-                            for key, value in nand_config.items():
-                                html += f"<li><strong>{key}:</strong> {value}</li>"
-                            html += "</ul>"
+                            parts.append("<h4>NAND Configuration</h4>")
+                            parts.append("<ul>")
+                            parts.extend(f"<li><strong>{key}:</strong> {value}</li>" for key, value in nand_config.items())
+                            parts.append("</ul>")
 
                         # Add ECC config summary
                         if "ecc_config" in spec_data:
                             ecc_config = spec_data["ecc_config"]
-                            html += "<h4>Error Correction</h4>"
-                            html += "<ul>"
-                            for key, value in ecc_config.items():
-                                html += f"<li><strong>{key}:</strong> {value}</li>"
-                            html += "</ul>"
+                            parts.append("<h4>Error Correction</h4>")
+                            parts.append("<ul>")
+                            parts.extend(f"<li><strong>{key}:</strong> {value}</li>" for key, value in ecc_config.items())
+                            parts.append("</ul>")
 
                         # Add Bad Block Management config
                         if "bbm_config" in spec_data:
                             bbm_config = spec_data["bbm_config"]
-                            html += "<h4>Bad Block Management</h4>"
-                            html += "<ul>"
-                            for key, value in bbm_config.items():
-                                html += f"<li><strong>{key}:</strong> {value}</li>"
-                            html += "</ul>"
+                            parts.append("<h4>Bad Block Management</h4>")
+                            parts.append("<ul>")
+                            parts.extend(f"<li><strong>{key}:</strong> {value}</li>" for key, value in bbm_config.items())
+                            parts.append("</ul>")
 
                         # Add Wear Leveling config
                         if "wl_config" in spec_data:
                             wl_config = spec_data["wl_config"]
-                            html += "<h4>Wear Leveling</h4>"
-                            html += "<ul>"
-                            for key, value in wl_config.items():
-                                html += f"<li><strong>{key}:</strong> {value}</li>"
-                            html += "</ul>"
+                            parts.append("<h4>Wear Leveling</h4>")
+                            parts.append("<ul>")
+                            parts.extend(f"<li><strong>{key}:</strong> {value}</li>" for key, value in wl_config.items())
+                            parts.append("</ul>")
                 except Exception:
                     # If parsing fails, just show a portion of the raw spec but with syntax highlighting
-                    html += "<p>Firmware specification preview:</p>"
-                    html += f"<pre style='background-color: #f5f5f5; padding: 10px; border-radius: 5px;'>{spec[:1000]}...</pre>"
+                    parts.append("<p>Firmware specification preview:</p>")
+                    parts.append(f"<pre style='background-color: #f5f5f5; padding: 10px; border-radius: 5px;'>{spec[:1000]}...</pre>")
 
                 # Add button for downloading the spec
-                html += "<p><button onclick=\"alert('Use the Save option from the toolbar to save the specification')\">Download Specification</button></p>"
+                parts.append(
+                    "<p><button onclick=\"alert('Use the Save option from the toolbar to save the specification')\">Download Specification</button></p>"
+                )
 
             else:
-                html += "<p>No firmware specification data available.</p>"
+                parts.append("<p>No firmware specification data available.</p>")
 
         elif "config" in self.current_results:
             # Device information and statistics
-            html += "<h3>Device Information</h3>"
+            parts.append("<h3>Device Information</h3>")
 
             # Add configuration summary
             config = self.current_results.get("config", {})
             if config:
-                html += "<h4>Configuration</h4>"
-                html += "<ul>"
-                for key, value in config.items():
-                    if isinstance(value, dict):
-                        continue  # Skip nested dictionaries for summary
-                    html += f"<li><strong>{key}:</strong> {value}</li>"
-                html += "</ul>"
+                parts.append("<h4>Configuration</h4>")
+                parts.append("<ul>")
+                # Skip nested dictionaries for summary
+                parts.extend(f"<li><strong>{key}:</strong> {value}</li>" for key, value in config.items() if not isinstance(value, dict))
+                parts.append("</ul>")
 
             # Add firmware summary
             firmware = self.current_results.get("firmware", {})
             if firmware:
-                html += "<h4>Firmware</h4>"
-                html += "<ul>"
-                for key, value in firmware.items():
-                    if isinstance(value, dict):
-                        continue  # Skip nested dictionaries for summary
-                    html += f"<li><strong>{key}:</strong> {value}</li>"
-                html += "</ul>"
+                parts.append("<h4>Firmware</h4>")
+                parts.append("<ul>")
+                # Skip nested dictionaries for summary
+                parts.extend(f"<li><strong>{key}:</strong> {value}</li>" for key, value in firmware.items() if not isinstance(value, dict))
+                parts.append("</ul>")
 
             # Add statistics summary
             stats = self.current_results.get("statistics", {})
             if stats:
-                html += "<h3>Performance Statistics</h3>"
+                parts.append("<h3>Performance Statistics</h3>")
 
                 # Operation counts
-                html += "<div style='display: flex; flex-wrap: wrap;'>"
-                html += "<div style='flex: 1; min-width: 300px;'>"
-                html += "<h4>Operations</h4>"
-                html += "<ul>"
-                for op in ["reads", "writes", "erases", "ecc_corrections"]:
-                    if op in stats:
-                        html += f"<li><strong>{op.capitalize()}:</strong> {stats[op]}</li>"
-                html += "</ul>"
-                html += "</div>"
+                parts.append("<div style='display: flex; flex-wrap: wrap;'>")
+                parts.append("<div style='flex: 1; min-width: 300px;'>")
+                parts.append("<h4>Operations</h4>")
+                parts.append("<ul>")
+                parts.extend(
+                    f"<li><strong>{op.capitalize()}:</strong> {stats[op]}</li>" for op in ["reads", "writes", "erases", "ecc_corrections"] if op in stats
+                )
+                parts.append("</ul>")
+                parts.append("</div>")
 
                 # Performance metrics
                 if "performance" in stats:
                     perf = stats["performance"]
-                    html += "<div style='flex: 1; min-width: 300px;'>"
-                    html += "<h4>Performance</h4>"
-                    html += "<ul>"
+                    parts.append("<div style='flex: 1; min-width: 300px;'>")
+                    parts.append("<h4>Performance</h4>")
+                    parts.append("<ul>")
                     for key, value in perf.items():
                         if isinstance(value, float):
-                            html += f"<li><strong>{key}:</strong> {value:.2f}</li>"
+                            parts.append(f"<li><strong>{key}:</strong> {value:.2f}</li>")
                         else:
-                            html += f"<li><strong>{key}:</strong> {value}</li>"
-                    html += "</ul>"
-                    html += "</div>"
+                            parts.append(f"<li><strong>{key}:</strong> {value}</li>")
+                    parts.append("</ul>")
+                    parts.append("</div>")
 
-                html += "</div>"  # Close flex container
+                parts.append("</div>")  # Close flex container
 
                 # Second row of stats
-                html += "<div style='display: flex; flex-wrap: wrap;'>"
+                parts.append("<div style='display: flex; flex-wrap: wrap;'>")
 
                 # Cache metrics
                 if "cache" in stats:
                     cache = stats["cache"]
-                    html += "<div style='flex: 1; min-width: 300px;'>"
-                    html += "<h4>Cache</h4>"
-                    html += "<ul>"
+                    parts.append("<div style='flex: 1; min-width: 300px;'>")
+                    parts.append("<h4>Cache</h4>")
+                    parts.append("<ul>")
                     for key, value in cache.items():
                         if key == "hit_ratio":
-                            html += f"<li><strong>Hit Ratio:</strong> {value:.2f}%</li>"
+                            parts.append(f"<li><strong>Hit Ratio:</strong> {value:.2f}%</li>")
                         else:
-                            html += f"<li><strong>{key}:</strong> {value}</li>"
-                    html += "</ul>"
-                    html += "</div>"
+                            parts.append(f"<li><strong>{key}:</strong> {value}</li>")
+                    parts.append("</ul>")
+                    parts.append("</div>")
 
                 # Bad block metrics
                 if "bad_blocks" in stats:
                     bb = stats["bad_blocks"]
-                    html += "<div style='flex: 1; min-width: 300px;'>"
-                    html += "<h4>Bad Blocks</h4>"
-                    html += "<ul>"
+                    parts.append("<div style='flex: 1; min-width: 300px;'>")
+                    parts.append("<h4>Bad Blocks</h4>")
+                    parts.append("<ul>")
                     for key, value in bb.items():
                         if key == "percentage":
-                            html += f"<li><strong>Percentage:</strong> {value:.2f}%</li>"
+                            parts.append(f"<li><strong>Percentage:</strong> {value:.2f}%</li>")
                         else:
-                            html += f"<li><strong>{key}:</strong> {value}</li>"
-                    html += "</ul>"
-                    html += "</div>"
+                            parts.append(f"<li><strong>{key}:</strong> {value}</li>")
+                    parts.append("</ul>")
+                    parts.append("</div>")
 
-                html += "</div>"  # Close flex container
+                parts.append("</div>")  # Close flex container
 
                 # Wear leveling metrics
                 if "wear_leveling" in stats:
                     wl = stats["wear_leveling"]
-                    html += "<h4>Wear Leveling</h4>"
-                    html += "<ul>"
+                    parts.append("<h4>Wear Leveling</h4>")
+                    parts.append("<ul>")
                     for key, value in wl.items():
+                        if isinstance(value, (dict, list)):
+                            continue  # Histogram and distribution data are plotted, not listed
                         if isinstance(value, float):
-                            html += f"<li><strong>{key}:</strong> {value:.2f}</li>"
+                            parts.append(f"<li><strong>{key}:</strong> {value:.2f}</li>")
                         else:
-                            html += f"<li><strong>{key}:</strong> {value}</li>"
-                    html += "</ul>"
+                            parts.append(f"<li><strong>{key}:</strong> {value}</li>")
+                    parts.append("</ul>")
 
         elif result_type == "test_results":
             # Test results summary
-            html += "<h3>Test Results</h3>"
+            parts.append("<h3>Test Results</h3>")
 
             test_type = self.current_results.get("test_type", "Unknown")
             passed = self.current_results.get("passed", False)
 
-            html += f"<p><strong>Test Type:</strong> {test_type}</p>"
+            parts.append(f"<p><strong>Test Type:</strong> {test_type}</p>")
 
             if passed:
-                html += "<p style='color: green; font-weight: bold; font-size: 1.2em;'>Test Result: PASSED ✓</p>"
+                parts.append("<p style='color: green; font-weight: bold; font-size: 1.2em;'>Test Result: PASSED ✓</p>")
             else:
-                html += "<p style='color: red; font-weight: bold; font-size: 1.2em;'>Test Result: FAILED ✗</p>"
+                parts.append("<p style='color: red; font-weight: bold; font-size: 1.2em;'>Test Result: FAILED ✗</p>")
 
             # Add test details
             details = self.current_results.get("details", {})
             if details:
-                html += "<h4>Test Details</h4>"
-                html += "<ul>"
-                for key, value in details.items():
-                    html += f"<li><strong>{key}:</strong> {value}</li>"
-                html += "</ul>"
+                parts.append("<h4>Test Details</h4>")
+                parts.append("<ul>")
+                parts.extend(f"<li><strong>{key}:</strong> {value}</li>" for key, value in details.items())
+                parts.append("</ul>")
 
                 # Add visual representation if available
                 if "tests_run" in details and "tests_passed" in details and "tests_failed" in details:
@@ -703,193 +919,181 @@ class ResultViewer(QWidget):
                         passed_percent = (tests_passed / tests_run) * 100
                         failed_percent = (tests_failed / tests_run) * 100
 
-                        html += "<div style='margin-top: 20px; margin-bottom: 20px;'>"
-                        html += "<div style='height: 30px; background-color: #f5f5f5; border-radius: 15px; overflow: hidden;'>"
+                        parts.append("<div style='margin-top: 20px; margin-bottom: 20px;'>")
+                        parts.append("<div style='height: 30px; background-color: #f5f5f5; border-radius: 15px; overflow: hidden;'>")
 
                         if passed_percent > 0:
-                            html += f"<div style='height: 100%; width: {passed_percent}%; background-color: #28a745; float: left;'></div>"
+                            parts.append(f"<div style='height: 100%; width: {passed_percent}%; background-color: #28a745; float: left;'></div>")
 
                         if failed_percent > 0:
-                            html += f"<div style='height: 100%; width: {failed_percent}%; background-color: #dc3545; float: left;'></div>"
+                            parts.append(f"<div style='height: 100%; width: {failed_percent}%; background-color: #dc3545; float: left;'></div>")
 
-                        html += "</div>"
-                        html += (
+                        parts.append("</div>")
+                        parts.append(
                             f"<div style='text-align: center; margin-top: 5px;'>"
                             f"{tests_passed} passed ({passed_percent:.1f}%), "
                             f"{tests_failed} failed ({failed_percent:.1f}%)</div>"
                         )
-                        html += "</div>"
+                        parts.append("</div>")
 
         else:
             # Generic summary for other types of results
-            html += "<p>Results available. Select the Details tab for more information.</p>"
+            parts.append("<p>Results available. Select the Details tab for more information.</p>")
 
             # Print keys from the results
-            html += "<p>Result contains the following data:</p>"
-            html += "<ul>"
-            for key in self.current_results.keys():
-                html += f"<li>{key}</li>"
-            html += "</ul>"
+            parts.append("<p>Result contains the following data:</p>")
+            parts.append("<ul>")
+            parts.extend(f"<li>{key}</li>" for key in self.current_results.keys())
+            parts.append("</ul>")
 
         # Set the HTML content
-        self.summary_text.setHtml(html)
+        self.summary_text.setHtml("".join(parts))
+        self.summary_results = self.current_results
+
+    def parse_spec(self, spec):
+        """Parse a firmware spec YAML string, reusing the previous result when the text is unchanged"""
+        if spec != self.parsed_spec_text:
+            self.parsed_spec = yaml.load(spec, Loader=YAML_LOADER)
+            self.parsed_spec_text = spec
+        return self.parsed_spec
 
     def update_details(self):
         """Update the details tree with current results"""
         if not self.current_results:
             return
 
-        # Clear the tree
-        self.details_tree.clear()
-
-        # Helper function to recursively add items
-        def add_items(parent, key, value):
+        # Helper function to recursively build detached items
+        def build_item(key, value):
+            key = str(key)
             if isinstance(value, dict):
-                item = QTreeWidgetItem(parent, [key, ""])
-                for k, v in value.items():
-                    add_items(item, k, v)
+                item = QTreeWidgetItem([key, ""])
+                item.addChildren([build_item(k, v) for k, v in value.items()])
             elif isinstance(value, list):
-                item = QTreeWidgetItem(parent, [key, f"Array ({len(value)} items)"])
-                for i, v in enumerate(value):
-                    add_items(item, f"[{i}]", v)
+                item = QTreeWidgetItem([key, f"Array ({len(value)} items)"])
+                item.addChildren([build_item(f"[{i}]", v) for i, v in enumerate(value)])
             else:
-                item = QTreeWidgetItem(parent, [key, str(value)])
+                item = QTreeWidgetItem([key, str(value)])
 
                 # Color-code certain values
-                if key.lower() in ["status", "state"]:
-                    if str(value).lower() in ["good", "ready", "passed", "true"]:
-                        item.setForeground(1, QColor(0, 128, 0))  # Green
-                    elif str(value).lower() in ["bad", "error", "failed", "false"]:
-                        item.setForeground(1, QColor(255, 0, 0))  # Red
-
-        # Add top-level items
-        for key, value in self.current_results.items():
-            add_items(self.details_tree, key, value)
+                if key.lower() in ("status", "state"):
+                    status = str(value).lower()
+                    if status in GOOD_STATUS_VALUES:
+                        item.setForeground(1, BRUSH_GREEN)
+                    elif status in BAD_STATUS_VALUES:
+                        item.setForeground(1, BRUSH_RED)
+            return item
+
+        items = [build_item(key, value) for key, value in self.current_results.items()]
+
+        # Swap the whole tree in with a single relayout
+        self.details_tree.setUpdatesEnabled(False)
+        self.details_tree.blockSignals(True)
+        try:
+            self.details_tree.clear()
+            self.details_tree.addTopLevelItems(items)
 
-        # Expand top-level items
-        for i in range(self.details_tree.topLevelItemCount()):
-            self.details_tree.topLevelItem(i).setExpanded(True)
+            # Expand top-level items
+            for item in items:
+                item.setExpanded(True)
+        finally:
+            self.details_tree.blockSignals(False)
+            self.details_tree.setUpdatesEnabled(True)
 
     def update_visualization(self, vis_type=None):
         """Update the visualization with current results, with improved error handling and display options"""
         if not self.current_results:
             # Clear the visualization
-            self.result_visualizer.axes.clear()
+            self.result_visualizer.clear_plot()
             self.result_visualizer.axes.text(0.5, 0.5, "No data available for visualization", ha="center", va="center", fontsize=12)
-            self.result_visualizer.fig.canvas.draw()
+            self.result_visualizer.draw_idle()
             return
 
         # Use parameter if provided, otherwise use combo box
         if vis_type is None:
             vis_type = self.visualization_type.currentText()
 
+        # The canvas already shows this visualization of the current results
+        if vis_type == self.visualization_shown:
+            return
+
         # Determine what to visualize based on the visualization type and results
-        if vis_type == "Bad Block Distribution":
-            # Find bad block data in results
-            if "statistics" in self.current_results:
-                stats = self.current_results["statistics"]
-                if "bad_blocks" in stats:
-                    bad_blocks = stats["bad_blocks"]
-                    count = bad_blocks.get("count", 0)
-
-                    # Generate some dummy block numbers for visualization if needed
-                    if count > 0:
-                        bad_block_list = []
-
-                        # Try to extract actual bad block numbers if available
-                        try:
-                            if "list" in bad_blocks:
-                                bad_block_list = bad_blocks["list"]
-                            else:
-                                # In a real implementation, you'd use actual bad block numbers
-                                # Here we generate some for visualization
-                                num_blocks = self.current_results.get("config", {}).get("num_blocks", 1024)
-                                bad_block_list = sorted([int(num_blocks * i / count) for i in range(count)])
-                        except Exception as e:
-                            self.logger.warning(f"Could not extract bad block list: {str(e)}")
-                            # Generate dummy block numbers
-                            num_blocks = self.current_results.get("config", {}).get("num_blocks", 1024)
-                            bad_block_list = sorted([int(num_blocks * i / count) for i in range(count)])
-
-                        self.result_visualizer.plot_bad_block_distribution(bad_block_list)
-                    else:
-                        self.result_visualizer.plot_bad_block_distribution([])
-                else:
-                    self.result_visualizer.plot_bad_block_distribution([])
-            else:
-                self.result_visualizer.plot_bad_block_distribution([])
+        handler = self.visualization_handlers.get(vis_type)
+        if handler is not None:
+            handler(self.current_results.get("statistics") or {})
 
-        elif vis_type == "Wear Leveling":
-            # Find wear leveling data in results
-            if "statistics" in self.current_results:
-                stats = self.current_results["statistics"]
-                if "wear_leveling" in stats:
-                    wear_data = stats["wear_leveling"]
-
-                    # Add distribution data if available
-                    if "distribution" not in wear_data:
-                        # Generate synthetic distribution based on min/max/avg
-                        min_val = wear_data.get("min_erase_count", 0)
-                        max_val = wear_data.get("max_erase_count", 0)
-                        avg_val = wear_data.get("avg_erase_count", 0)
-                        std_dev = wear_data.get("std_dev", 0)
-
-                        # Simple distribution approximation
-                        distribution = {}
-                        num_blocks = self.current_results.get("config", {}).get("num_blocks", 1024)
-
-                        # Create a more realistic looking distribution if we have std_dev
-                        if std_dev > 0:
-                            import numpy as np
-
-                            try:
-                                # Create a normal distribution around avg with std_dev
-                                samples = np.random.normal(avg_val, std_dev, 20)
-                                # Clip values between min and max
-                                samples = np.clip(samples, min_val, max_val)
-
-                                # Create a distribution with 20 points
-                                for i, val in enumerate(samples):
-                                    distribution[i] = int(val)
-                            except:
-                                # Fallback to simple approximation
-                                for i in range(20):
-                                    # Linear interpolation between min and max
-                                    val = min_val + (max_val - min_val) * (i / 19)
-                                    distribution[i] = int(val)
-                        else:
-                            # Simple linear distribution
-                            for i in range(20):
-                                # Linear interpolation between min and max
-                                val = min_val + (max_val - min_val) * (i / 19)
-                                distribution[i] = int(val)
+        self.visualization_shown = vis_type
 
-                        wear_data["distribution"] = distribution
+    def visualize_bad_blocks(self, stats):
+        """Plot the bad block distribution from result statistics"""
+        bad_blocks = stats.get("bad_blocks")
+        if not bad_blocks:
+            self.result_visualizer.plot_bad_block_distribution([])
+            return
 
-                    self.result_visualizer.plot_wear_leveling(wear_data)
-                else:
-                    self.result_visualizer.plot_wear_leveling({})
-            else:
-                self.result_visualizer.plot_wear_leveling({})
+        count = bad_blocks.get("count", 0)
+        if count <= 0:
+            self.result_visualizer.plot_bad_block_distribution([])
+            return
+
+        config = self.current_results.get("config") or {}
+        num_blocks = config.get("num_blocks", 1024)
 
-        elif vis_type == "Test Results":
-            # Check if we have test results
-            if "test_type" in self.current_results:
-                self.result_visualizer.plot_test_results(self.current_results)
+        # Try to extract actual bad block numbers if available
+        try:
+            if "list" in bad_blocks:
+                # Drop out-of-range block numbers with one mask rather than a per-element check
+                block_numbers = np.asarray(bad_blocks["list"], dtype=np.int64)
+                bad_block_list = block_numbers[(block_numbers >= 0) & (block_numbers < num_blocks)]
             else:
-                self.result_visualizer.plot_test_results({})
+                # In a real implementation, you'd use actual bad block numbers
+                # Here we generate some evenly spaced ones for visualization
+                bad_block_list = np.arange(count, dtype=np.int64) * num_blocks // count
+        except Exception as e:
+            self.logger.warning(f"Could not extract bad block list: {str(e)}")
+            # Generate dummy block numbers
+            bad_block_list = np.arange(count, dtype=np.int64) * num_blocks // count
 
-        elif vis_type == "Performance Metrics":
-            # Find performance metrics in results
-            if "statistics" in self.current_results:
-                stats = self.current_results["statistics"]
-                if "performance" in stats:
-                    perf_data = stats["performance"]
-                    self.result_visualizer.plot_performance(perf_data)
-                else:
-                    self.result_visualizer.plot_performance({})
+        self.result_visualizer.plot_bad_block_distribution(bad_block_list)
+
+    def visualize_wear_leveling(self, stats):
+        """Plot the wear distribution from result statistics"""
+        wear_data = stats.get("wear_leveling")
+        if wear_data is None:
+            self.result_visualizer.plot_wear_leveling({})
+            return
+
+        # Approximate a distribution only when no histogram was recorded
+        if "distribution" not in wear_data and "histogram" not in wear_data:
+            # Generate synthetic distribution based on min/max/avg
+            min_val = wear_data.get("min_erase_count", 0)
+            max_val = wear_data.get("max_erase_count", 0)
+            avg_val = wear_data.get("avg_erase_count", 0)
+            std_dev = wear_data.get("std_dev", 0)
+
+            # Create a more realistic looking distribution if we have std_dev, else a linear one
+            if std_dev > 0:
+                # 20 samples of a normal distribution around avg, clipped to [min, max]
+                values = np.clip(RNG.normal(avg_val, std_dev, 20), min_val, max_val)
             else:
-                self.result_visualizer.plot_performance({})
+                # Linear interpolation between min and max
+                values = np.linspace(min_val, max_val, 20)
+            distribution = dict(enumerate(values.astype(int).tolist()))
+
+            # Plot a copy so the stored results, also read by the raw data worker, stay unchanged
+            wear_data = dict(wear_data, distribution=distribution)
+
+        self.result_visualizer.plot_wear_leveling(wear_data)
+
+    def visualize_test_results(self, stats):
+        """Plot test results, which live at the top level of the results rather than in statistics"""
+        if "test_type" in self.current_results:
+            self.result_visualizer.plot_test_results(self.current_results)
+        else:
+            self.result_visualizer.plot_test_results({})
+
+    def visualize_performance(self, stats):
+        """Plot performance metrics from result statistics"""
+        self.result_visualizer.plot_performance(stats.get("performance") or {})
 
     def update_raw_data_format(self):
         """Update the raw data display based on selected format"""
@@ -899,20 +1103,62 @@ class ResultViewer(QWidget):
         format_type = self.format_combo.currentText()
         pretty = self.pretty_print.isChecked()
 
-        try:
-            if format_type == "JSON":
-                if pretty:
-                    text = json.dumps(self.current_results, indent=2)
-                else:
-                    text = json.dumps(self.current_results)
-            elif format_type == "YAML":
-                text = yaml.safe_dump(self.current_results, default_flow_style=not pretty)
-            else:  # Text
-                text = str(self.current_results)
-
-            self.raw_data_text.setText(text)
-        except Exception as e:
-            self.raw_data_text.setText(f"Error formatting data: {str(e)}")
+        # The view already shows the current results in this format
+        if (format_type, pretty) == self.raw_data_shown:
+            if self.raw_data_worker is not None:
+                self.raw_data_update_pending = True  # Drop the running worker's older output
+            return
+
+        # Reuse the text already serialized for these results and settings
+        cached = self.raw_data_cache.get((format_type, pretty))
+        if cached is not None:
+            self.show_raw_text(cached)
+            self.raw_data_shown = (format_type, pretty)
+            if self.raw_data_worker is not None:
+                self.raw_data_update_pending = True  # Drop the running worker's older output
+            return
+
+        # One serialization at a time; a request made meanwhile reruns with the latest settings
+        if self.raw_data_worker is not None:
+            self.raw_data_update_pending = True
+            return
+
+        self.raw_data_worker = RawDataWorker(self.current_results, format_type, pretty)
+        self.raw_data_worker.text_ready.connect(self.apply_raw_data)
+        self.raw_data_worker.error_occurred.connect(self.handle_raw_data_error)
+        self.raw_data_worker.finished.connect(self.handle_raw_data_finished)
+        self.raw_data_worker.start()
+
+    def apply_raw_data(self, text):
+        """Show serialized results unless a newer format was requested meanwhile"""
+        worker = self.raw_data_worker
+        if worker.results is self.current_results:
+            self.raw_data_cache[(worker.format_type, worker.pretty)] = text
+        if not self.raw_data_update_pending:
+            self.show_raw_text(text)
+            if worker.results is self.current_results:
+                self.raw_data_shown = (worker.format_type, worker.pretty)
+
+    def show_raw_text(self, text):
+        """Display serialized results, truncated to keep the text layout cheap"""
+        if len(text) > self.RAW_DATA_DISPLAY_LIMIT:
+            text = text[: self.RAW_DATA_DISPLAY_LIMIT] + "\n... [truncated, use Export to view full]"
+        self.raw_data_text.setPlainText(text)
+
+    def handle_raw_data_error(self, error_msg):
+        """Show a serialization error unless a newer format was requested meanwhile"""
+        if not self.raw_data_update_pending:
+            self.raw_data_text.setPlainText(f"Error formatting data: {error_msg}")
+            self.raw_data_shown = None
+
+    def handle_raw_data_finished(self):
+        """Release the finished raw data worker and run any update requested meanwhile"""
+        self.raw_data_worker.wait()
+        self.raw_data_worker = None
+
+        if self.raw_data_update_pending:
+            self.raw_data_update_pending = False
+            self.update_raw_data_format()
 
     def update_raw_data(self):
         """Update the raw data display"""
@@ -922,8 +1168,9 @@ class ResultViewer(QWidget):
         """Refresh the results display"""
         self.logger.debug("Refreshing results display")
 
-        # Re-apply current results to update all views
+        # Re-apply current results to update all views, rebuilding the summary too
         if self.current_results:
+            self.summary_results = None
             self.update_results(self.current_results)
 
     def export_results(self):
@@ -937,36 +1184,42 @@ class ResultViewer(QWidget):
 
         # Get file extension based on format
         if format_type == "JSON":
-            file_filter = "JSON Files (*.json);;All Files (*)"
+            file_filter = "JSON Files (*.json);;Compressed JSON Files (*.json.gz);;All Files (*)"
             default_ext = ".json"
         elif format_type == "YAML":
-            file_filter = "YAML Files (*.yaml *.yml);;All Files (*)"
+            file_filter = "YAML Files (*.yaml *.yml);;Compressed YAML Files (*.yaml.gz *.yml.gz);;All Files (*)"
             default_ext = ".yaml"
         else:  # Text
             file_filter = "Text Files (*.txt);;All Files (*)"
             default_ext = ".txt"
 
         # Open file dialog
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getSaveFileName(self, "Export Results", f"results{default_ext}", file_filter)
+        file_path, _ = QFileDialog.getSaveFileName(self, "Export Results", f"results{default_ext}", file_filter)
 
         if file_path:
             try:
                 # Ensure file has correct extension
-                if not file_path.endswith(default_ext):
+                compressed = file_path.endswith(".gz")
+                if not compressed and not file_path.endswith(default_ext):
                     file_path += default_ext
 
                 # Write results to file
-                with open(file_path, "w") as f:
-                    if format_type == "JSON":
-                        pretty = self.pretty_print.isChecked()
-                        if pretty:
-                            json.dump(self.current_results, f, indent=2)
-                        else:
-                            json.dump(self.current_results, f)
+                pretty = self.pretty_print.isChecked()
+                cached = self.raw_data_cache.get((format_type, pretty))
+                # Fastest gzip level: the repeated keys compress well even at level 1
+                opener = gzip.open(file_path, "wt", encoding="utf-8", compresslevel=1) if compressed else open(file_path, "w", encoding="utf-8")
+                with opener as f:
+                    if cached is not None:
+                        # Already serialized with these settings for the raw data tab
+                        f.write(cached)
+                    elif format_type == "JSON":
+                        f.write(RawDataWorker.dump_json(self.current_results, pretty))
                     elif format_type == "YAML":
-                        yaml.safe_dump(self.current_results, f, default_flow_style=not self.pretty_print.isChecked())
-                    else:  # Text
+                        # Stream straight into the file rather than building the whole document first
+                        yaml.dump(self.current_results, f, Dumper=YAML_DUMPER, default_flow_style=not pretty)
+                    elif pretty:  # Text
+                        pprint.pprint(self.current_results, stream=f, compact=True, width=RawDataWorker.TEXT_WIDTH)
+                    else:
                         f.write(str(self.current_results))
 
                 QMessageBox.information(self, "Export Successful", f"Results exported successfully to {file_path}")
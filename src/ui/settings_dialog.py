@@ -1,9 +1,10 @@
 # src/ui/settings_dialog.py
 
+import copy
 import os
 
 import yaml
-from PyQt5.QtCore import Qt, pyqtSignal
+from PyQt5.QtCore import Qt, QThread, QTimer, pyqtSignal
 from PyQt5.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -25,20 +26,106 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-from src.utils.config import load_config
+from src.utils.config import YAML_DUMPER, load_config
 from src.utils.logger import get_logger
 
 
+class ConfigLoader(QThread):
+    """Worker thread to read and parse a config file without freezing the settings dialog"""
+
+    config_loaded = pyqtSignal(str, object, object)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, config_path):
+        super().__init__()
+        self.config_path = config_path
+
+    def run(self):
+        try:
+            st = os.stat(self.config_path)
+            source_key = (st.st_mtime_ns, st.st_size)
+            self.config_loaded.emit(self.config_path, source_key, load_config(self.config_path, cache=True))
+        except Exception as e:
+            self.error_occurred.emit(str(e))
+
+
 class SettingsDialog(QDialog):
     """Enhanced settings dialog for configuring the 3D NAND Optimization Tool"""
 
     # Signal emitted when settings are changed
     settings_changed = pyqtSignal(dict)
 
+    # Default configs already loaded by any dialog, by path: ((mtime_ns, size), config)
+    # Each dialog gets its own copy, so edits in one dialog never reach the cache or another dialog
+    CONFIG_CACHE = {}
+
+    # Controls set straight from the config, per tab: (attribute, config path, default, setter, conversion)
+    CONFIG_FIELDS = {
+        "nand_tab": [
+            ("page_size", ("nand_config", "page_size"), 0, "setValue", None),
+            ("block_size", ("nand_config", "block_size"), 0, "setValue", None),
+            ("num_blocks", ("nand_config", "num_blocks"), 0, "setValue", None),
+            ("oob_size", ("nand_config", "oob_size"), 0, "setValue", None),
+            ("num_planes", ("nand_config", "num_planes"), 0, "setValue", None),
+            ("read_latency", ("timing_config", "read_latency"), 0.1, "setValue", None),
+            ("write_latency", ("timing_config", "write_latency"), 0.5, "setValue", None),
+            ("erase_latency", ("timing_config", "erase_latency"), 2.0, "setValue", None),
+            ("error_rate", ("simulation", "error_rate"), 0.0001, "setValue", None),
+            ("initial_bad_blocks", ("simulation", "initial_bad_block_rate"), 0.002, "setValue", None),
+            ("simulation_mode", ("simulation", "enabled"), False, "setChecked", None),
+        ],
+        "optimization_tab": [
+            ("bch_m", ("optimization_config", "error_correction", "bch_params", "m"), 8, "setValue", None),
+            ("ldpc_n", ("optimization_config", "error_correction", "ldpc_params", "n"), 1024, "setValue", None),
+            ("ldpc_dv", ("optimization_config", "error_correction", "ldpc_params", "d_v"), 3, "setValue", None),
+            ("ldpc_dc", ("optimization_config", "error_correction", "ldpc_params", "d_c"), 6, "setValue", None),
+            ("ldpc_systematic", ("optimization_config", "error_correction", "ldpc_params", "systematic"), True, "setChecked", None),
+            ("compression_enabled", ("optimization_config", "compression", "enabled"), True, "setChecked", None),
+            ("compression_algorithm", ("optimization_config", "compression", "algorithm"), "lz4", "setCurrentText", str.capitalize),
+            ("compression_level", ("optimization_config", "compression", "level"), 3, "setValue", None),
+            ("cache_enabled", ("optimization_config", "caching", "enabled"), True, "setChecked", None),
+            ("cache_capacity", ("optimization_config", "caching", "capacity"), 1024, "setValue", None),
+            ("cache_policy", ("optimization_config", "caching", "policy"), "lru", "setCurrentText", str.upper),
+            ("cache_ttl", ("optimization_config", "caching", "ttl"), 60, "setValue", None),
+            ("wl_threshold", ("optimization_config", "wear_leveling", "threshold"), 1000, "setValue", None),
+            ("wl_method", ("optimization_config", "wear_leveling", "method"), "dynamic", "setCurrentText", str.capitalize),
+            ("max_workers", ("optimization_config", "parallelism", "max_workers"), 4, "setValue", None),
+        ],
+        "firmware_tab": [
+            ("fw_version", ("firmware_config", "version"), "1.0.0", "setText", None),
+            ("read_retry", ("firmware_config", "read_retry"), True, "setChecked", None),
+            ("max_retries", ("firmware_config", "max_retries"), 3, "setValue", None),
+            ("data_scrambling", ("firmware_config", "data_scrambling"), True, "setChecked", None),
+            ("scrambling_seed", ("firmware_config", "scrambling_seed"), "0xA5A5A5A5", "setText", None),
+            ("template_path", ("template_path",), "", "setText", None),
+        ],
+        "ui_tab": [
+            ("ui_theme", ("ui_config", "theme"), "light", "setCurrentText", str.capitalize),
+            ("font_size", ("ui_config", "font_size"), 12, "setValue", None),
+            ("update_interval", ("ui_config", "update_interval"), 5, "setValue", None),
+            ("chart_antialiasing", ("ui_config", "chart", "antialiasing"), True, "setChecked", None),
+            ("chart_animations", ("ui_config", "chart", "animations"), True, "setChecked", None),
+        ],
+        "logging_tab": [
+            ("log_level", ("logging", "level"), "INFO", "setCurrentText", None),
+            ("log_file", ("logging", "file"), "logs/optimization_tool.log", "setText", None),
+            ("max_log_size", ("logging", "max_size"), 10, "setValue", None),
+            ("backup_count", ("logging", "backup_count"), 5, "setValue", None),
+            ("console_logging", ("logging", "console"), True, "setChecked", None),
+        ],
+    }
+
+    # Largest BCH correction capability t for each field order m accepted by the m spinbox: 2^(m-1) - 1
+    BCH_MAX_T = {m: (1 << (m - 1)) - 1 for m in range(3, 17)}
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.logger = get_logger(__name__)
         self.config = None
+
+        # Background parse of the default config file
+        self.config_loader = None
+
         self.init_ui()
         self.load_config()
 
@@ -53,19 +140,23 @@ class SettingsDialog(QDialog):
         # Create tab widget for different settings categories
         self.tab_widget = QTabWidget()
 
-        # Create tabs
-        self.nand_tab = self.create_nand_tab()
-        self.optimization_tab = self.create_optimization_tab()
-        self.firmware_tab = self.create_firmware_tab()
-        self.ui_tab = self.create_ui_tab()
-        self.logging_tab = self.create_logging_tab()
-
-        # Add tabs to the widget
-        self.tab_widget.addTab(self.nand_tab, "NAND Configuration")
-        self.tab_widget.addTab(self.optimization_tab, "Optimization")
-        self.tab_widget.addTab(self.firmware_tab, "Firmware")
-        self.tab_widget.addTab(self.ui_tab, "User Interface")
-        self.tab_widget.addTab(self.logging_tab, "Logging")
+        # Tabs are built the first time they are shown: (title, attribute, builder, config applier)
+        self.tab_builders = [
+            ("NAND Configuration", "nand_tab", self.create_nand_tab, self.apply_nand_config),
+            ("Optimization", "optimization_tab", self.create_optimization_tab, self.apply_optimization_config),
+            ("Firmware", "firmware_tab", self.create_firmware_tab, self.apply_firmware_config),
+            ("User Interface", "ui_tab", self.create_ui_tab, self.apply_ui_config),
+            ("Logging", "logging_tab", self.create_logging_tab, self.apply_logging_config),
+        ]
+        self.built_tabs = set()
+
+        # Add an empty page per tab to hold its controls once built
+        for title, _, _, _ in self.tab_builders:
+            page = QWidget()
+            QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
+            self.tab_widget.addTab(page, title)
+        self.tab_widget.currentChanged.connect(self.ensure_tab)
+        self.ensure_tab(0)
 
         main_layout.addWidget(self.tab_widget)
 
@@ -101,46 +192,80 @@ class SettingsDialog(QDialog):
 
         main_layout.addLayout(buttons_layout)
 
-    def create_nand_tab(self):
-        """Create the NAND configuration tab"""
-        tab = QWidget()
+    def ensure_tab(self, index):
+        """Build a settings tab the first time it is needed and fill it from the current config"""
+        if index < 0 or index in self.built_tabs:
+            return
+        self.built_tabs.add(index)
+
+        # Build, insert and fill the tab with repaints off so it is laid out and painted once
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            _, attribute, builder, apply_config = self.tab_builders[index]
+            tab = builder()
+            setattr(self, attribute, tab)
+            self.tab_widget.widget(index).layout().addWidget(tab)
+
+            if self.config:
+                apply_config()
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+
+    def build_all_tabs(self):
+        """Build every settings tab, e.g. before reading the whole configuration back from the controls"""
+        for index in range(len(self.tab_builders)):
+            self.ensure_tab(index)
+
+    @staticmethod
+    def create_spin_box(minimum, maximum, step=None, value=None, decimals=None, suffix=None, special_text=None):
+        """Create a spin box with its range and display options, a QDoubleSpinBox for a float range"""
+        spin_box = QDoubleSpinBox() if isinstance(minimum, float) else QSpinBox()
+        spin_box.setRange(minimum, maximum)
+        if decimals is not None:
+            spin_box.setDecimals(decimals)
+        if step is not None:
+            spin_box.setSingleStep(step)
+        if value is not None:
+            spin_box.setValue(value)
+        if suffix is not None:
+            spin_box.setSuffix(suffix)
+        if special_text is not None:
+            spin_box.setSpecialValueText(special_text)
+        return spin_box
+
+    @staticmethod
+    def create_scroll_tab():
+        """Create a tab whose settings scroll, returning the tab and the layout to add settings groups to"""
+        scroll_content = QWidget()
+        scroll_layout = QVBoxLayout(scroll_content)
 
-        # Use a scroll area to handle many settings
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
         scroll.setFrameShape(scroll.NoFrame)
+        scroll.setWidget(scroll_content)
 
-        scroll_content = QWidget()
-        scroll_layout = QVBoxLayout(scroll_content)
+        tab = QWidget()
+        QVBoxLayout(tab).addWidget(scroll)
+        return tab, scroll_layout
+
+    def create_nand_tab(self):
+        """Create the NAND configuration tab"""
+        tab, scroll_layout = self.create_scroll_tab()
 
         # NAND hardware configuration group
         hw_group = QGroupBox("NAND Hardware Configuration")
         hw_layout = QFormLayout()
 
         # Create input fields
-        self.page_size = QSpinBox()
-        self.page_size.setRange(512, 32768)
-        self.page_size.setSingleStep(512)
-        self.page_size.setSpecialValueText("Default")
-
-        self.block_size = QSpinBox()
-        self.block_size.setRange(16, 512)
-        self.block_size.setSingleStep(16)
-        self.block_size.setSpecialValueText("Default")
-
-        self.num_blocks = QSpinBox()
-        self.num_blocks.setRange(1, 100000)
-        self.num_blocks.setSingleStep(128)
-        self.num_blocks.setSpecialValueText("Default")
-
-        self.oob_size = QSpinBox()
-        self.oob_size.setRange(0, 1024)
-        self.oob_size.setSingleStep(16)
-        self.oob_size.setSpecialValueText("Default")
-
-        self.num_planes = QSpinBox()
-        self.num_planes.setRange(1, 8)
-        self.num_planes.setSpecialValueText("Default")
+        self.page_size = self.create_spin_box(512, 32768, step=512, special_text="Default")
+
+        self.block_size = self.create_spin_box(16, 512, step=16, special_text="Default")
+
+        self.num_blocks = self.create_spin_box(1, 100000, step=128, special_text="Default")
+
+        self.oob_size = self.create_spin_box(0, 1024, step=16, special_text="Default")
+
+        self.num_planes = self.create_spin_box(1, 8, special_text="Default")
 
         # Add fields to layout
         hw_layout.addRow("Page Size (bytes):", self.page_size)
@@ -157,23 +282,11 @@ class SettingsDialog(QDialog):
         timing_layout = QFormLayout()
 
         # Create timing fields
-        self.read_latency = QDoubleSpinBox()
-        self.read_latency.setRange(0.001, 100.0)
-        self.read_latency.setDecimals(3)
-        self.read_latency.setSingleStep(0.1)
-        self.read_latency.setSuffix(" ms")
-
-        self.write_latency = QDoubleSpinBox()
-        self.write_latency.setRange(0.01, 1000.0)
-        self.write_latency.setDecimals(2)
-        self.write_latency.setSingleStep(1.0)
-        self.write_latency.setSuffix(" ms")
-
-        self.erase_latency = QDoubleSpinBox()
-        self.erase_latency.setRange(0.1, 10000.0)
-        self.erase_latency.setDecimals(1)
-        self.erase_latency.setSingleStep(10.0)
-        self.erase_latency.setSuffix(" ms")
+        self.read_latency = self.create_spin_box(0.001, 100.0, step=0.1, decimals=3, suffix=" ms")
+
+        self.write_latency = self.create_spin_box(0.01, 1000.0, step=1.0, decimals=2, suffix=" ms")
+
+        self.erase_latency = self.create_spin_box(0.1, 10000.0, step=10.0, decimals=1, suffix=" ms")
 
         # Add timing fields to layout
         timing_layout.addRow("Read Latency:", self.read_latency)
@@ -188,16 +301,9 @@ class SettingsDialog(QDialog):
         sim_layout = QFormLayout()
 
         # Create simulation fields
-        self.error_rate = QDoubleSpinBox()
-        self.error_rate.setRange(0.0, 1.0)
-        self.error_rate.setDecimals(6)
-        self.error_rate.setSingleStep(0.0001)
+        self.error_rate = self.create_spin_box(0.0, 1.0, step=0.0001, decimals=6)
 
-        self.initial_bad_blocks = QDoubleSpinBox()
-        self.initial_bad_blocks.setRange(0.0, 1.0)
-        self.initial_bad_blocks.setDecimals(4)
-        self.initial_bad_blocks.setSingleStep(0.001)
-        self.initial_bad_blocks.setSuffix(" ratio")
+        self.initial_bad_blocks = self.create_spin_box(0.0, 1.0, step=0.001, decimals=4, suffix=" ratio")
 
         self.simulation_mode = QCheckBox("Enable Simulation Mode")
 
@@ -212,25 +318,11 @@ class SettingsDialog(QDialog):
         # Add some spacing and stretch at the bottom
         scroll_layout.addStretch()
 
-        scroll.setWidget(scroll_content)
-
-        # Main tab layout
-        layout = QVBoxLayout(tab)
-        layout.addWidget(scroll)
-
         return tab
 
     def create_optimization_tab(self):
         """Create the optimization configuration tab"""
-        tab = QWidget()
-
-        # Use a scroll area
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(scroll.NoFrame)
-
-        scroll_content = QWidget()
-        scroll_layout = QVBoxLayout(scroll_content)
+        tab, scroll_layout = self.create_scroll_tab()
 
         # Error Correction configuration
         ecc_group = QGroupBox("Error Correction")
@@ -240,19 +332,17 @@ class SettingsDialog(QDialog):
         self.ecc_algorithm = QComboBox()
         self.ecc_algorithm.addItems(["BCH", "LDPC", "None"])
         self.ecc_algorithm.currentTextChanged.connect(self.update_ecc_options)
+        # Resize the dialog only for user choices, once pending events are handled
+        self.ecc_algorithm.activated.connect(lambda: QTimer.singleShot(0, self.adjustSize))
 
         # BCH parameters
         self.bch_params_group = QGroupBox("BCH Parameters")
         bch_layout = QFormLayout()
 
-        self.bch_m = QSpinBox()
-        self.bch_m.setRange(3, 16)
-        self.bch_m.setValue(8)
+        self.bch_m = self.create_spin_box(3, 16, value=8)
         self.bch_m.valueChanged.connect(self.update_bch_t_max)
 
-        self.bch_t = QSpinBox()
-        self.bch_t.setRange(1, 127)
-        self.bch_t.setValue(4)
+        self.bch_t = self.create_spin_box(1, 127, value=4)
 
         bch_layout.addRow("m (Galois Field Size):", self.bch_m)
         bch_layout.addRow("t (Error Correction Capability):", self.bch_t)
@@ -263,18 +353,11 @@ class SettingsDialog(QDialog):
         self.ldpc_params_group = QGroupBox("LDPC Parameters")
         ldpc_layout = QFormLayout()
 
-        self.ldpc_n = QSpinBox()
-        self.ldpc_n.setRange(16, 32768)
-        self.ldpc_n.setValue(1024)
-        self.ldpc_n.setSingleStep(16)
+        self.ldpc_n = self.create_spin_box(16, 32768, step=16, value=1024)
 
-        self.ldpc_dv = QSpinBox()
-        self.ldpc_dv.setRange(2, 20)
-        self.ldpc_dv.setValue(3)
+        self.ldpc_dv = self.create_spin_box(2, 20, value=3)
 
-        self.ldpc_dc = QSpinBox()
-        self.ldpc_dc.setRange(2, 100)
-        self.ldpc_dc.setValue(6)
+        self.ldpc_dc = self.create_spin_box(2, 100, value=6)
 
         self.ldpc_systematic = QCheckBox("Systematic Code")
         self.ldpc_systematic.setChecked(True)
@@ -286,6 +369,11 @@ class SettingsDialog(QDialog):
 
         self.ldpc_params_group.setLayout(ldpc_layout)
 
+        # Reserve the wider group's width so switching algorithms does not change the layout width
+        params_width = max(self.bch_params_group.sizeHint().width(), self.ldpc_params_group.sizeHint().width())
+        self.bch_params_group.setMinimumWidth(params_width)
+        self.ldpc_params_group.setMinimumWidth(params_width)
+
         # Add to ECC group
         ecc_layout.addRow("Algorithm:", self.ecc_algorithm)
         ecc_group.setLayout(ecc_layout)
@@ -313,7 +401,8 @@ class SettingsDialog(QDialog):
         self.compression_level.setTickInterval(1)
 
         self.compression_level_label = QLabel("3")
-        self.compression_level.valueChanged.connect(lambda v: self.compression_level_label.setText(str(v)))
+        # Connect straight to the label's own slot so slider drags run no Python code
+        self.compression_level.valueChanged.connect(self.compression_level_label.setNum)
 
         # Add to compression group
         compression_layout.addRow(self.compression_enabled)
@@ -338,18 +427,12 @@ class SettingsDialog(QDialog):
         self.cache_enabled.setChecked(True)
         self.cache_enabled.stateChanged.connect(self.update_cache_options)
 
-        self.cache_capacity = QSpinBox()
-        self.cache_capacity.setRange(1, 10000)
-        self.cache_capacity.setValue(1024)
-        self.cache_capacity.setSuffix(" entries")
+        self.cache_capacity = self.create_spin_box(1, 10000, value=1024, suffix=" entries")
 
         self.cache_policy = QComboBox()
         self.cache_policy.addItems(["LRU", "LFU", "FIFO", "TTL"])
 
-        self.cache_ttl = QDoubleSpinBox()
-        self.cache_ttl.setRange(0.1, 3600.0)
-        self.cache_ttl.setValue(60.0)
-        self.cache_ttl.setSuffix(" seconds")
+        self.cache_ttl = self.create_spin_box(0.1, 3600.0, value=60.0, suffix=" seconds")
 
         # Add to cache group
         cache_layout.addRow(self.cache_enabled)
@@ -366,9 +449,7 @@ class SettingsDialog(QDialog):
         wl_layout = QFormLayout()
 
         # Create wear leveling fields
-        self.wl_threshold = QSpinBox()
-        self.wl_threshold.setRange(10, 10000)
-        self.wl_threshold.setValue(1000)
+        self.wl_threshold = self.create_spin_box(10, 10000, value=1000)
 
         self.wl_method = QComboBox()
         self.wl_method.addItems(["Static", "Dynamic", "Hybrid"])
@@ -386,9 +467,7 @@ class SettingsDialog(QDialog):
         parallelism_layout = QFormLayout()
 
         # Create parallelism fields
-        self.max_workers = QSpinBox()
-        self.max_workers.setRange(1, 32)
-        self.max_workers.setValue(4)
+        self.max_workers = self.create_spin_box(1, 32, value=4)
 
         # Add to parallelism group
         parallelism_layout.addRow("Max Worker Threads:", self.max_workers)
@@ -400,12 +479,6 @@ class SettingsDialog(QDialog):
         # Add some spacing and stretch at the bottom
         scroll_layout.addStretch()
 
-        scroll.setWidget(scroll_content)
-
-        # Main tab layout
-        layout = QVBoxLayout(tab)
-        layout.addWidget(scroll)
-
         return tab
 
     def create_firmware_tab(self):
@@ -425,9 +498,7 @@ class SettingsDialog(QDialog):
         self.read_retry = QCheckBox("Enable Read Retry")
         self.read_retry.setChecked(True)
 
-        self.max_retries = QSpinBox()
-        self.max_retries.setRange(1, 10)
-        self.max_retries.setValue(3)
+        self.max_retries = self.create_spin_box(1, 10, value=3)
 
         self.data_scrambling = QCheckBox("Enable Data Scrambling")
         self.data_scrambling.setChecked(True)
@@ -484,26 +555,16 @@ class SettingsDialog(QDialog):
         self.ui_theme = QComboBox()
         self.ui_theme.addItems(["Light", "Dark", "System"])
 
-        self.font_size = QSpinBox()
-        self.font_size.setRange(8, 24)
-        self.font_size.setValue(12)
-        self.font_size.setSuffix(" pt")
+        self.font_size = self.create_spin_box(8, 24, value=12, suffix=" pt")
 
-        self.update_interval = QSpinBox()
-        self.update_interval.setRange(1, 60)
-        self.update_interval.setValue(5)
-        self.update_interval.setSuffix(" seconds")
+        self.update_interval = self.create_spin_box(1, 60, value=5, suffix=" seconds")
 
         # Window size
         window_size_layout = QHBoxLayout()
 
-        self.window_width = QSpinBox()
-        self.window_width.setRange(800, 3840)
-        self.window_width.setValue(1200)
+        self.window_width = self.create_spin_box(800, 3840, value=1200)
 
-        self.window_height = QSpinBox()
-        self.window_height.setRange(600, 2160)
-        self.window_height.setValue(800)
+        self.window_height = self.create_spin_box(600, 2160, value=800)
 
         window_size_layout.addWidget(self.window_width)
         window_size_layout.addWidget(QLabel("×"))
@@ -566,14 +627,9 @@ class SettingsDialog(QDialog):
         log_file_layout.addWidget(self.log_file)
         log_file_layout.addWidget(browse_button)
 
-        self.max_log_size = QSpinBox()
-        self.max_log_size.setRange(1, 1000)
-        self.max_log_size.setValue(10)
-        self.max_log_size.setSuffix(" MB")
+        self.max_log_size = self.create_spin_box(1, 1000, value=10, suffix=" MB")
 
-        self.backup_count = QSpinBox()
-        self.backup_count.setRange(0, 100)
-        self.backup_count.setValue(5)
+        self.backup_count = self.create_spin_box(0, 100, value=5)
 
         # Console logging
         self.console_logging = QCheckBox("Enable Console Logging")
@@ -602,14 +658,11 @@ class SettingsDialog(QDialog):
         self.bch_params_group.setVisible(algorithm == "bch")
         self.ldpc_params_group.setVisible(algorithm == "ldpc")
 
-        # Adjust dialog size
-        self.adjustSize()
-
     def update_bch_t_max(self, m_value):
         """Update the maximum value for t based on m"""
-        # Maximum t is 2^(m-1) - 1
-        max_t = (1 << (m_value - 1)) - 1
-        self.bch_t.setMaximum(max_t)
+        max_t = self.BCH_MAX_T[m_value]
+        if self.bch_t.maximum() != max_t:
+            self.bch_t.setMaximum(max_t)
 
         # If current value is too high, adjust it
         if self.bch_t.value() > max_t:
@@ -631,42 +684,75 @@ class SettingsDialog(QDialog):
 
     def browse_template(self):
         """Open a file dialog to select a template file"""
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getOpenFileName(self, "Select Template File", "", "YAML Files (*.yaml);;All Files (*)")
+        file_path, _ = QFileDialog.getOpenFileName(self, "Select Template File", "", "YAML Files (*.yaml);;All Files (*)")
 
         if file_path:
             self.template_path.setText(file_path)
 
     def browse_log_file(self):
         """Open a file dialog to select a log file"""
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getSaveFileName(self, "Select Log File", "", "Log Files (*.log);;All Files (*)")
+        file_path, _ = QFileDialog.getSaveFileName(self, "Select Log File", "", "Log Files (*.log);;All Files (*)")
 
         if file_path:
             self.log_file.setText(file_path)
 
     def load_config(self):
         """Load configuration from default file"""
-        try:
-            # Try to load config from fixed location
-            config_path = os.path.join("resources", "config", "config.yaml")
+        # Try the fixed location, then an alternate one
+        for config_path in (os.path.join("resources", "config", "config.yaml"), "config.yaml"):
             if os.path.exists(config_path):
-                self.config = load_config(config_path)
-                self.apply_config_to_ui()
-                return
+                break
+        else:
+            # If no config found, load defaults
+            self.load_default_config()
+            return
 
-            # If that fails, try an alternate location
-            config_path = "config.yaml"
-            if os.path.exists(config_path):
-                self.config = load_config(config_path)
+        try:
+            # Reuse the config parsed by an earlier dialog while the file is unchanged
+            cached = self.cached_config(config_path)
+            if cached is not None:
+                self.config = cached
                 self.apply_config_to_ui()
                 return
-
         except Exception as e:
             self.logger.error(f"Error loading config: {str(e)}")
+            self.load_default_config()
+            return
 
-        # If no config found or error occurred, load defaults
+        # Show defaults until the file has been parsed in the background
         self.load_default_config()
+        self.config_loader = ConfigLoader(config_path)
+        self.config_loader.config_loaded.connect(self.apply_loaded_config)
+        self.config_loader.error_occurred.connect(self.handle_config_load_error)
+        self.config_loader.finished.connect(self.handle_config_loader_finished)
+        self.config_loader.start()
+
+    def apply_loaded_config(self, config_path, source_key, config):
+        """Cache a config parsed in the background and show it"""
+        self.CONFIG_CACHE[os.path.abspath(config_path)] = (source_key, config)
+        unchanged = getattr(config, "config", config) == self.config
+        self.config = copy.deepcopy(config)
+
+        # The defaults on screen already show this config; skip the pass so edits made meanwhile stay
+        if not unchanged:
+            self.apply_config_to_ui()
+
+    def handle_config_load_error(self, error_msg):
+        """Keep the defaults when the config file could not be loaded"""
+        self.logger.error(f"Error loading config: {error_msg}")
+
+    def handle_config_loader_finished(self):
+        """Release the finished config loader"""
+        self.config_loader.wait()
+        self.config_loader = None
+
+    def cached_config(self, config_path):
+        """Return a copy of the config parsed earlier from this file, or None if it was not loaded yet or has changed"""
+        st = os.stat(config_path)
+        cached = self.CONFIG_CACHE.get(os.path.abspath(config_path))
+        if cached is not None and cached[0] == (st.st_mtime_ns, st.st_size):
+            return copy.deepcopy(cached[1])
+        return None
 
     def load_default_config(self):
         """Load default configuration"""
@@ -715,116 +801,79 @@ class SettingsDialog(QDialog):
         if not self.config:
             return
 
-        # NAND Configuration
-        nand_config = self.config.get("nand_config", {})
-        self.page_size.setValue(nand_config.get("page_size", 0))
-        self.block_size.setValue(nand_config.get("block_size", 0))
-        self.num_blocks.setValue(nand_config.get("num_blocks", 0))
-        self.oob_size.setValue(nand_config.get("oob_size", 0))
-        self.num_planes.setValue(nand_config.get("num_planes", 0))
-
-        # Timing Configuration (if exists)
-        timing_config = self.config.get("timing_config", {})
-        self.read_latency.setValue(timing_config.get("read_latency", 0.1))
-        self.write_latency.setValue(timing_config.get("write_latency", 0.5))
-        self.erase_latency.setValue(timing_config.get("erase_latency", 2.0))
-
-        # Simulation Configuration (if exists)
-        sim_config = self.config.get("simulation", {})
-        self.error_rate.setValue(sim_config.get("error_rate", 0.0001))
-        self.initial_bad_blocks.setValue(sim_config.get("initial_bad_block_rate", 0.002))
-        self.simulation_mode.setChecked(sim_config.get("enabled", False))
-
-        # Optimization Configuration
-        opt_config = self.config.get("optimization_config", {})
-
-        # Error Correction
-        ecc_config = opt_config.get("error_correction", {})
-        ecc_algo = ecc_config.get("algorithm", "bch").upper()
-        self.ecc_algorithm.setCurrentText(ecc_algo)
-
-        # BCH Parameters
-        bch_params = ecc_config.get("bch_params", {})
-        self.bch_m.setValue(bch_params.get("m", 8))
-        self.bch_t.setValue(bch_params.get("t", 4))
-
-        # LDPC Parameters
-        ldpc_params = ecc_config.get("ldpc_params", {})
-        self.ldpc_n.setValue(ldpc_params.get("n", 1024))
-        self.ldpc_dv.setValue(ldpc_params.get("d_v", 3))
-        self.ldpc_dc.setValue(ldpc_params.get("d_c", 6))
-        self.ldpc_systematic.setChecked(ldpc_params.get("systematic", True))
-
-        # Update ECC parameter visibility
-        self.update_ecc_options(ecc_algo)
-
-        # Compression Configuration
-        comp_config = opt_config.get("compression", {})
-        self.compression_enabled.setChecked(comp_config.get("enabled", True))
-        self.compression_algorithm.setCurrentText(comp_config.get("algorithm", "lz4").capitalize())
-        self.compression_level.setValue(comp_config.get("level", 3))
-
-        # Update compression options
-        self.update_compression_options(self.compression_enabled.checkState())
-
-        # Caching Configuration
-        cache_config = opt_config.get("caching", {})
-        self.cache_enabled.setChecked(cache_config.get("enabled", True))
-        self.cache_capacity.setValue(cache_config.get("capacity", 1024))
-        self.cache_policy.setCurrentText(cache_config.get("policy", "lru").upper())
-        self.cache_ttl.setValue(cache_config.get("ttl", 60))
-
-        # Update cache options
-        self.update_cache_options(self.cache_enabled.checkState())
-
-        # Wear Leveling Configuration
-        wl_config = opt_config.get("wear_leveling", {})
-        self.wl_threshold.setValue(wl_config.get("threshold", 1000))
-        self.wl_method.setCurrentText(wl_config.get("method", "dynamic").capitalize())
-
-        # Parallelism Configuration
-        parallelism_config = opt_config.get("parallelism", {})
-        self.max_workers.setValue(parallelism_config.get("max_workers", 4))
-
-        # Firmware Configuration
-        fw_config = self.config.get("firmware_config", {})
-        self.fw_version.setText(fw_config.get("version", "1.0.0"))
-        self.read_retry.setChecked(fw_config.get("read_retry", True))
-        self.max_retries.setValue(fw_config.get("max_retries", 3))
-        self.data_scrambling.setChecked(fw_config.get("data_scrambling", True))
-        self.scrambling_seed.setText(fw_config.get("scrambling_seed", "0xA5A5A5A5"))
-
-        # Template Configuration (if exists)
-        template_path = self.config.get("template_path", "")
-        self.template_path.setText(template_path)
-
-        # UI Configuration
-        ui_config = self.config.get("ui_config", {})
-        self.ui_theme.setCurrentText(ui_config.get("theme", "light").capitalize())
-        self.font_size.setValue(ui_config.get("font_size", 12))
-        self.update_interval.setValue(ui_config.get("update_interval", 5))
+        # Tabs not built yet are filled in by ensure_tab; repaint once after all controls are set
+        self.tab_widget.setUpdatesEnabled(False)
+        try:
+            for index in sorted(self.built_tabs):
+                self.tab_builders[index][3]()
+        finally:
+            self.tab_widget.setUpdatesEnabled(True)
+
+    def apply_config_fields(self, tab):
+        """Set a tab's plain controls from the config, following CONFIG_FIELDS"""
+        for attribute, path, default, setter, convert in self.CONFIG_FIELDS[tab]:
+            node = self.config
+            for key in path[:-1]:
+                node = node.get(key, {})
+            value = node.get(path[-1], default)
+            if convert is not None:
+                value = convert(value)
+            getattr(getattr(self, attribute), setter)(value)
+
+    def apply_nand_config(self):
+        """Apply NAND, timing and simulation settings to the NAND tab"""
+        self.apply_config_fields("nand_tab")
+
+    def apply_optimization_config(self):
+        """Apply optimization settings to the optimization tab"""
+        # Set the controls with their change handlers muted, then run each handler once
+        signal_sources = [self.ecc_algorithm, self.bch_m, self.compression_enabled, self.compression_level, self.cache_enabled]
+        for widget in signal_sources:
+            widget.blockSignals(True)
+        try:
+            self.apply_config_fields("optimization_tab")
+
+            # Error Correction
+            ecc_config = self.config.get("optimization_config", {}).get("error_correction", {})
+            ecc_algo = ecc_config.get("algorithm", "bch").upper()
+            self.ecc_algorithm.setCurrentText(ecc_algo)
+
+            # BCH t is limited by m, so it is set once the new limit is in place
+            self.update_bch_t_max(self.bch_m.value())
+            self.bch_t.setValue(ecc_config.get("bch_params", {}).get("t", 4))
+
+            # Update dependent options
+            self.update_ecc_options(ecc_algo)
+            self.compression_level_label.setNum(self.compression_level.value())
+            self.update_compression_options(self.compression_enabled.checkState())
+            self.update_cache_options(self.cache_enabled.checkState())
+        finally:
+            for widget in signal_sources:
+                widget.blockSignals(False)
+
+    def apply_firmware_config(self):
+        """Apply firmware settings to the firmware tab"""
+        self.apply_config_fields("firmware_tab")
+
+    def apply_ui_config(self):
+        """Apply user interface settings to the UI tab"""
+        self.apply_config_fields("ui_tab")
 
         # Window Size
-        window_size = ui_config.get("window_size", [1200, 800])
+        window_size = self.config.get("ui_config", {}).get("window_size", [1200, 800])
         if isinstance(window_size, list) and len(window_size) >= 2:
             self.window_width.setValue(window_size[0])
             self.window_height.setValue(window_size[1])
 
-        # Chart Configuration
-        chart_config = ui_config.get("chart", {})
-        self.chart_antialiasing.setChecked(chart_config.get("antialiasing", True))
-        self.chart_animations.setChecked(chart_config.get("animations", True))
-
-        # Logging Configuration
-        logging_config = self.config.get("logging", {})
-        self.log_level.setCurrentText(logging_config.get("level", "INFO"))
-        self.log_file.setText(logging_config.get("file", "logs/optimization_tool.log"))
-        self.max_log_size.setValue(logging_config.get("max_size", 10))
-        self.backup_count.setValue(logging_config.get("backup_count", 5))
-        self.console_logging.setChecked(logging_config.get("console", True))
+    def apply_logging_config(self):
+        """Apply logging settings to the logging tab"""
+        self.apply_config_fields("logging_tab")
 
     def get_config_from_ui(self):
         """Get configuration from UI controls"""
+        # Every control is read below, so build the tabs not opened yet
+        self.build_all_tabs()
+
         config = {}
 
         # NAND Configuration
@@ -931,8 +980,7 @@ class SettingsDialog(QDialog):
 
     def load_config_from_file(self):
         """Load configuration from a file"""
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getOpenFileName(self, "Load Configuration", "", "YAML Files (*.yaml);;All Files (*)")
+        file_path, _ = QFileDialog.getOpenFileName(self, "Load Configuration", "", "YAML Files (*.yaml);;All Files (*)")
 
         if file_path:
             try:
@@ -946,17 +994,26 @@ class SettingsDialog(QDialog):
 
     def save_config_to_file(self):
         """Save configuration to a file"""
-        file_dialog = QFileDialog()
-        file_path, _ = file_dialog.getSaveFileName(self, "Save Configuration", "", "YAML Files (*.yaml);;All Files (*)")
+        file_path, _ = QFileDialog.getSaveFileName(self, "Save Configuration", "", "YAML Files (*.yaml);;All Files (*)")
 
         if file_path:
             try:
                 # Get current config from UI
                 config = self.get_config_from_ui()
 
-                # Save to file
-                with open(file_path, "w") as f:
-                    yaml.safe_dump(config, f, default_flow_style=False)
+                # Serialize first, then write it in one go to a temporary file that replaces the target,
+                # so a failed save never leaves a truncated config behind
+                text = yaml.dump(config, Dumper=YAML_DUMPER, default_flow_style=False)
+                temp_path = file_path + ".tmp"
+                try:
+                    with open(temp_path, "w") as f:
+                        f.write(text)
+                    os.replace(temp_path, file_path)
+                except OSError:
+                    if os.path.exists(temp_path):
+                        os.remove(temp_path)
+                    raise
+                self.CONFIG_CACHE.pop(os.path.abspath(file_path), None)
 
                 QMessageBox.information(self, "Configuration Saved", f"Configuration saved successfully to {file_path}")
 
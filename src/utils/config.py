@@ -1,7 +1,14 @@
 # src/utils/config.py
 
+import json
+import os
+
 import yaml
 
+# Prefer the libyaml-backed safe loader and dumper when PyYAML was built with them
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 class Config:
     def __init__(self, config):
@@ -15,7 +22,7 @@ class Config:
 
     def save(self, config_file):
         with open(config_file, "w") as file:
-            yaml.safe_dump(self.config, file)
+            yaml.dump(self.config, file, Dumper=YAML_DUMPER)
 
     @property
     def ecc_config(self):
@@ -30,12 +37,43 @@ class Config:
         return self.get("optimization_config", {}).get("wear_leveling", {})
 
 
-def load_config(config_file):
+def load_config(config_file, cache=False):
+    if not cache:
+        with open(config_file, "r") as file:
+            return Config(yaml.load(file, Loader=YAML_LOADER))
+
+    # A JSON copy of the parsed YAML is kept beside the file and reused while the YAML is unchanged
+    cache_file = os.fspath(config_file) + ".json"
+    source = os.stat(config_file)
+    source_key = [source.st_mtime_ns, source.st_size]
+    try:
+        with open(cache_file, "r") as file:
+            cached = json.load(file)
+        if cached.get("source") == source_key:
+            return Config(cached["config"])
+    except (OSError, ValueError, AttributeError, KeyError):
+        pass  # Missing or unreadable cache; parse the YAML
+
     with open(config_file, "r") as file:
-        config = yaml.safe_load(file)
+        config = yaml.load(file, Loader=YAML_LOADER)
+
+    # Only cache configs that survive a JSON round trip unchanged, written through a temporary file
+    # so an interrupted write never leaves a truncated cache behind
+    temp_file = cache_file + ".tmp"
+    try:
+        if json.loads(json.dumps(config)) == config:
+            with open(temp_file, "w") as file:
+                json.dump({"source": source_key, "config": config}, file)
+            os.replace(temp_file, cache_file)
+    except (OSError, TypeError, ValueError):
+        if os.path.exists(temp_file):
+            try:
+                os.remove(temp_file)
+            except OSError:
+                pass
     return Config(config)
 
 
 def save_config(config, config_file):
     with open(config_file, "w") as file:
-        yaml.safe_dump(config.config, file)
+        yaml.dump(config.config, file, Dumper=YAML_DUMPER)
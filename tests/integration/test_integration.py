@@ -148,6 +148,21 @@ class TestIntegration(unittest.TestCase):
         # Basic system test passed
         self.assertTrue(True)
 
+    def test_bad_block_mask_matches_is_bad_block(self):
+        num_blocks = self.nand_controller.num_blocks
+        for block in (20, self.nand_controller.user_blocks + 1, num_blocks - 1):
+            self.nand_controller.bad_block_manager.mark_bad_block(block)
+
+        mask = self.nand_controller.get_bad_block_mask()
+
+        self.assertEqual(mask.shape, (num_blocks,))
+        self.assertEqual(mask.tolist(), [bool(self.nand_controller.is_bad_block(block)) for block in range(num_blocks)])
+        self.assertTrue(mask[num_blocks - 1])
+
+        # The mask is a snapshot, not a view of the controller's table
+        mask[0] = True
+        self.assertFalse(self.nand_controller.bad_block_manager.is_bad_block(0))
+
 
 if __name__ == "__main__":
     unittest.main()
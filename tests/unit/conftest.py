@@ -0,0 +1,11 @@
+# tests/unit/conftest.py
+
+import os
+
+# Qt widgets in the UI tests need no display
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+# Created before any test module imports src.ui, so matplotlib's Qt backend finds a running Qt application
+app = QApplication.instance() or QApplication([])
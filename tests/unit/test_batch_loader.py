@@ -0,0 +1,109 @@
+# tests/unit/test_batch_loader.py
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import io
+import json
+import unittest
+from unittest.mock import patch
+
+from src.ui import main_window
+from src.ui.main_window import BatchLoaderWorker
+
+OPERATIONS = [
+    {"type": "read", "block": 1, "page": 0},
+    {"type": "write", "block": 2, "page": 3, "data": "abc", "ratio": 0.5},
+    {"type": "erase", "block": 4, "nested": {"item": [1, 2]}},
+]
+
+# Each fixture and the operations every decoder must yield for it
+FIXTURES = {
+    "list": (json.dumps(OPERATIONS), OPERATIONS),
+    "empty list": ("[]", []),
+    "object": (json.dumps({"operations": OPERATIONS}), []),
+    "object with item member": (json.dumps({"item": OPERATIONS}), []),
+    "object with item list": (json.dumps({"item": [{"type": "read"}]}), []),
+    "scalar": ("5", []),
+    "string": ('"item"', []),
+    "null": ("null", []),
+}
+
+MALFORMED = {
+    "truncated list": '[{"type": "read"',
+    "truncated object": '{"item": [',
+    "empty": "",
+}
+
+
+class TestBatchLoaderDecoders(unittest.TestCase):
+    """Every decoder path must treat the same batch file the same way"""
+
+    def decoder_paths(self):
+        paths = {"json": (None, None)}
+        if main_window.orjson is not None:
+            paths["orjson"] = (main_window.orjson, None)
+        if main_window.ijson is not None:
+            paths["ijson"] = (None, main_window.ijson)
+        return paths
+
+    def load(self, text, orjson, ijson):
+        worker = BatchLoaderWorker("unused")
+        with patch.object(main_window, "orjson", orjson), patch.object(main_window, "ijson", ijson):
+            return list(worker.iter_operations(io.BytesIO(text.encode("utf-8"))))
+
+    def test_fixtures_on_every_path(self):
+        for path, (orjson, ijson) in self.decoder_paths().items():
+            for name, (text, expected) in FIXTURES.items():
+                with self.subTest(path=path, fixture=name):
+                    self.assertEqual(self.load(text, orjson, ijson), expected)
+
+    def test_malformed_files_fail_on_every_path(self):
+        for path, (orjson, ijson) in self.decoder_paths().items():
+            for name, text in MALFORMED.items():
+                with self.subTest(path=path, fixture=name):
+                    with self.assertRaises(Exception):
+                        self.load(text, orjson, ijson)
+
+    @unittest.skipIf(main_window.ijson is None, "ijson is not installed")
+    def test_ijson_yields_floats(self):
+        operations = self.load(json.dumps(OPERATIONS), None, main_window.ijson)
+        self.assertIsInstance(operations[1]["ratio"], float)
+
+
+class TestBatchLoaderWorker(unittest.TestCase):
+    def run_worker(self, text, chunk_size=2):
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            f.write(text)
+        self.addCleanup(os.remove, f.name)
+
+        worker = BatchLoaderWorker(f.name, chunk_size=chunk_size)
+        chunks, counts, errors = [], [], []
+        worker.rows_loaded.connect(chunks.append)
+        worker.load_complete.connect(counts.append)
+        worker.error_occurred.connect(errors.append)
+        worker.run()
+        return chunks, counts, errors
+
+    def test_rows_emitted_in_chunks(self):
+        chunks, counts, errors = self.run_worker(json.dumps(OPERATIONS))
+        self.assertEqual([len(chunk) for chunk in chunks], [2, 1])
+        self.assertEqual(chunks[0][0], (OPERATIONS[0], "read", str({"block": 1, "page": 0})))
+        self.assertEqual(counts, [3])
+        self.assertEqual(errors, [])
+
+    def test_non_list_loads_nothing(self):
+        chunks, counts, errors = self.run_worker(json.dumps({"item": OPERATIONS}))
+        self.assertEqual((chunks, counts, errors), ([], [0], []))
+
+    def test_malformed_file_reports_error(self):
+        chunks, counts, errors = self.run_worker('[{"type": "read"')
+        self.assertEqual(counts, [])
+        self.assertEqual(len(errors), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,117 @@
+# tests/unit/test_config.py
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import builtins
+import json
+import pathlib
+import unittest
+from unittest.mock import patch
+
+import yaml
+
+from src.utils.config import Config, load_config
+
+
+class TestLoadConfig(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_file = os.path.join(self.temp_dir.name, "config.yaml")
+        self.cache_file = self.config_file + ".json"
+        self.write_yaml({"nand_config": {"num_blocks": 1024}})
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_yaml(self, config, mtime_ns=None):
+        with open(self.config_file, "w") as file:
+            yaml.dump(config, file)
+        if mtime_ns is not None:
+            os.utime(self.config_file, ns=(mtime_ns, mtime_ns))
+
+    def read_cache(self):
+        with open(self.cache_file, "r") as file:
+            return json.load(file)
+
+    def test_no_cache_by_default(self):
+        config = load_config(self.config_file)
+        self.assertEqual(config.get("nand_config"), {"num_blocks": 1024})
+        self.assertEqual(os.listdir(self.temp_dir.name), ["config.yaml"])
+
+    def test_interrupted_cache_write_leaves_no_file(self):
+        with patch("src.utils.config.os.replace", side_effect=OSError("disk full")):
+            config = load_config(self.config_file, cache=True)
+        self.assertEqual(config.get("nand_config"), {"num_blocks": 1024})
+        self.assertEqual(os.listdir(self.temp_dir.name), ["config.yaml"])
+
+    def test_load_writes_cache(self):
+        config = load_config(self.config_file, cache=True)
+        self.assertIsInstance(config, Config)
+        self.assertEqual(config.get("nand_config"), {"num_blocks": 1024})
+        self.assertEqual(self.read_cache()["config"], {"nand_config": {"num_blocks": 1024}})
+
+    def test_cache_hit_skips_yaml_parse(self):
+        load_config(self.config_file, cache=True)
+        with patch("src.utils.config.yaml.load") as mock_load:
+            config = load_config(self.config_file, cache=True)
+        mock_load.assert_not_called()
+        self.assertEqual(config.get("nand_config"), {"num_blocks": 1024})
+
+    def test_cache_invalidated_by_mtime_change(self):
+        self.write_yaml({"nand_config": {"num_blocks": 1024}}, mtime_ns=1_000_000_000)
+        load_config(self.config_file, cache=True)
+        # Same size, different content and mtime
+        self.write_yaml({"nand_config": {"num_blocks": 2048}}, mtime_ns=2_000_000_000)
+        config = load_config(self.config_file, cache=True)
+        self.assertEqual(config.get("nand_config"), {"num_blocks": 2048})
+
+    def test_cache_invalidated_by_size_change(self):
+        self.write_yaml({"nand_config": {"num_blocks": 1024}}, mtime_ns=1_000_000_000)
+        load_config(self.config_file, cache=True)
+        # Same mtime, different size
+        self.write_yaml({"nand_config": {"num_blocks": 1024, "pages_per_block": 64}}, mtime_ns=1_000_000_000)
+        config = load_config(self.config_file, cache=True)
+        self.assertEqual(config.get("nand_config"), {"num_blocks": 1024, "pages_per_block": 64})
+
+    def test_corrupt_cache_falls_back_to_yaml(self):
+        load_config(self.config_file, cache=True)
+        with open(self.cache_file, "w") as file:
+            file.write("{not json")
+        config = load_config(self.config_file, cache=True)
+        self.assertEqual(config.get("nand_config"), {"num_blocks": 1024})
+        # The corrupt cache is replaced by a valid one
+        self.assertEqual(self.read_cache()["config"], {"nand_config": {"num_blocks": 1024}})
+
+    def test_config_without_json_round_trip_not_cached(self):
+        # Integer keys come back from JSON as strings, so this config must not be cached
+        self.write_yaml({1: "x"})
+        config = load_config(self.config_file, cache=True)
+        self.assertEqual(config.config, {1: "x"})
+        self.assertFalse(os.path.exists(self.cache_file))
+        self.assertEqual(load_config(self.config_file, cache=True).config, {1: "x"})
+
+    def test_unwritable_cache_still_loads(self):
+        real_open = builtins.open
+
+        def open_read_only(file, mode="r", *args, **kwargs):
+            if "w" in mode:
+                raise PermissionError(13, "Permission denied", file)
+            return real_open(file, mode, *args, **kwargs)
+
+        with patch("builtins.open", side_effect=open_read_only):
+            config = load_config(self.config_file, cache=True)
+        self.assertEqual(config.get("nand_config"), {"num_blocks": 1024})
+        self.assertFalse(os.path.exists(self.cache_file))
+
+    def test_path_argument(self):
+        config = load_config(pathlib.Path(self.config_file), cache=True)
+        self.assertEqual(config.get("nand_config"), {"num_blocks": 1024})
+        self.assertTrue(os.path.exists(self.cache_file))
+
+
+if __name__ == "__main__":
+    unittest.main()
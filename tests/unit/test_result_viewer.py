@@ -0,0 +1,37 @@
+# tests/unit/test_result_viewer.py
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import unittest
+
+from src.ui.result_viewer import ResultVisualizer
+
+
+class TestBadBlockDistribution(unittest.TestCase):
+    def setUp(self):
+        self.visualizer = ResultVisualizer()
+
+    def bin_total(self):
+        return int(self.visualizer.plot_artists["bars"].get_data().values.sum())
+
+    def count_text(self):
+        return self.visualizer.plot_artists["count_text"].get_text()
+
+    def test_duplicates_counted_once_on_fresh_render(self):
+        self.visualizer.plot_bad_block_distribution([5, 5, 5, 9999])
+        self.assertEqual(self.bin_total(), 2)
+        self.assertEqual(self.count_text(), "Bad Blocks: 2")
+
+    def test_duplicates_counted_once_on_in_place_update(self):
+        self.visualizer.plot_bad_block_distribution([7, 9999])
+        self.visualizer.plot_bad_block_distribution([5, 5, 5, 9999])
+        self.assertEqual(self.visualizer.plot_key, ("bad_block_bins", 9999))
+        self.assertEqual(self.bin_total(), 2)
+        self.assertEqual(self.count_text(), "Bad Blocks: 2")
+
+
+if __name__ == "__main__":
+    unittest.main()
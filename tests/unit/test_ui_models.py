@@ -0,0 +1,199 @@
+# tests/unit/test_ui_models.py
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
+
+import unittest
+
+from PyQt5.QtCore import Qt
+from src.ui.main_window import BatchOperationsModel, HexDumpModel, LogFilterProxyModel, LogModel
+
+
+def entry(i, level="INFO"):
+    return (f"00:00:{i:02d}", level, f"message {i}")
+
+
+def column(model, col):
+    return [model.data(model.index(row, col)) for row in range(model.rowCount())]
+
+
+class SignalRecorder:
+    """Record the row range of every insert/remove and each reset of a model"""
+
+    def __init__(self, model):
+        self.events = []
+        model.rowsInserted.connect(lambda parent, first, last: self.events.append(("inserted", first, last)))
+        model.rowsRemoved.connect(lambda parent, first, last: self.events.append(("removed", first, last)))
+        model.modelReset.connect(lambda: self.events.append(("reset",)))
+        model.dataChanged.connect(
+            lambda top_left, bottom_right, roles: self.events.append(
+                ("changed", top_left.row(), top_left.column(), bottom_right.row(), bottom_right.column())
+            )
+        )
+
+
+class TestLogModel(unittest.TestCase):
+    def setUp(self):
+        self.model = LogModel(max_entries=3)
+        self.recorder = SignalRecorder(self.model)
+
+    def test_add_entry_newest_first(self):
+        self.model.add_entry(*entry(1))
+        self.model.add_entry(*entry(2))
+        self.assertEqual(column(self.model, 2), ["message 2", "message 1"])
+        self.assertEqual(self.recorder.events, [("inserted", 0, 0), ("inserted", 0, 0)])
+
+    def test_add_entry_trims_oldest_on_overflow(self):
+        for i in range(4):
+            self.model.add_entry(*entry(i))
+        self.assertEqual(column(self.model, 2), ["message 3", "message 2", "message 1"])
+        self.assertEqual(self.recorder.events[-2:], [("removed", 2, 2), ("inserted", 0, 0)])
+
+    def test_add_entries_inserts_batch_in_one_step(self):
+        self.model.add_entries([entry(1), entry(2)])
+        self.assertEqual(column(self.model, 2), ["message 2", "message 1"])
+        self.assertEqual(self.recorder.events, [("inserted", 0, 1)])
+
+    def test_add_entries_trims_overflow(self):
+        self.model.add_entries([entry(1), entry(2)])
+        self.model.add_entries([entry(3), entry(4)])
+        self.assertEqual(column(self.model, 2), ["message 4", "message 3", "message 2"])
+        self.assertEqual(self.recorder.events[1:], [("removed", 1, 1), ("inserted", 0, 1)])
+
+    def test_add_entries_larger_than_buffer_resets(self):
+        self.model.add_entry(*entry(0))
+        self.model.add_entries([entry(i) for i in range(1, 6)])
+        self.assertEqual(column(self.model, 2), ["message 5", "message 4", "message 3"])
+        self.assertEqual(self.recorder.events[-1], ("reset",))
+
+    def test_add_entries_empty_is_noop(self):
+        self.model.add_entries([])
+        self.assertEqual(self.model.rowCount(), 0)
+        self.assertEqual(self.recorder.events, [])
+
+    def test_foreground_only_on_message_column(self):
+        self.model.add_entry(*entry(1, "ERROR"))
+        self.assertIsNotNone(self.model.data(self.model.index(0, 2), Qt.ForegroundRole))
+        self.assertIsNone(self.model.data(self.model.index(0, 1), Qt.ForegroundRole))
+
+    def test_clear(self):
+        self.model.add_entries([entry(1), entry(2)])
+        self.model.clear()
+        self.assertEqual(self.model.rowCount(), 0)
+
+
+class TestLogFilterProxyModel(unittest.TestCase):
+    def setUp(self):
+        self.model = LogModel(max_entries=10)
+        self.model.add_entries([entry(0, "DEBUG"), entry(1, "INFO"), entry(2, "WARNING"), entry(3, "ERROR"), entry(4, "CUSTOM")])
+        self.proxy = LogFilterProxyModel("INFO")
+        self.proxy.setSourceModel(self.model)
+
+    def test_hides_levels_below_minimum(self):
+        self.assertEqual(column(self.proxy, 1), ["CUSTOM", "ERROR", "WARNING", "INFO"])
+
+    def test_set_min_level_refilters(self):
+        self.proxy.set_min_level("ERROR")
+        self.assertEqual(column(self.proxy, 1), ["CUSTOM", "ERROR"])
+        self.proxy.set_min_level("DEBUG")
+        self.assertEqual(self.proxy.rowCount(), 5)
+
+    def test_unknown_minimum_shows_everything(self):
+        self.proxy.set_min_level("ALL")
+        self.assertEqual(self.proxy.rowCount(), 5)
+
+    def test_new_entries_are_filtered(self):
+        self.model.add_entries([entry(5, "DEBUG"), entry(6, "CRITICAL")])
+        self.assertEqual(column(self.proxy, 1)[0], "CRITICAL")
+        self.assertNotIn("message 5", column(self.proxy, 2))
+
+
+class TestHexDumpModel(unittest.TestCase):
+    def setUp(self):
+        self.model = HexDumpModel()
+
+    def test_row_formatting(self):
+        self.model.set_bytes(bytes(range(0x41, 0x51)))
+        self.assertEqual(self.model.rowCount(), 1)
+        self.assertEqual(self.model.data(self.model.index(0, 0)), "0x0000")
+        self.assertEqual(
+            self.model.data(self.model.index(0, 1)),
+            "41 42 43 44 45 46 47 48 49 4A 4B 4C 4D 4E 4F 50  |  ABCDEFGHIJKLMNOP",
+        )
+
+    def test_ascii_translation(self):
+        self.model.set_bytes(b"\x00\x1f \x7e\x7f\x80\xff")
+        text = self.model.data(self.model.index(0, 1))
+        self.assertEqual(text, "00 1F 20 7E 7F 80 FF  |  .. ~...")
+
+    def test_partial_last_row(self):
+        self.model.set_bytes(bytes(range(20)))
+        self.assertEqual(self.model.rowCount(), 2)
+        self.assertEqual(self.model.data(self.model.index(1, 0)), "0x0010")
+        self.assertEqual(self.model.data(self.model.index(1, 1)), "10 11 12 13  |  ....")
+
+    def test_empty_buffer(self):
+        self.model.set_bytes(None)
+        self.assertEqual(self.model.rowCount(), 0)
+
+    def test_only_display_role(self):
+        self.model.set_bytes(b"abc")
+        self.assertIsNone(self.model.data(self.model.index(0, 1), Qt.ToolTipRole))
+
+    def test_row_cache_reuses_and_evicts(self):
+        self.model.CACHE_ROWS = 2
+        self.model.set_bytes(bytes(64))
+        first = self.model.data(self.model.index(0, 1))
+        self.assertIs(self.model.data(self.model.index(0, 1)), first)
+
+        self.model.data(self.model.index(1, 1))
+        # Row 0 was used more recently than row 1, so row 1 is evicted first
+        self.model.data(self.model.index(0, 1))
+        self.model.data(self.model.index(2, 1))
+        self.assertEqual(list(self.model.row_cache), [0, 2])
+
+    def test_set_bytes_clears_row_cache(self):
+        self.model.set_bytes(b"a" * 16)
+        self.model.data(self.model.index(0, 1))
+        self.model.set_bytes(b"b" * 16)
+        self.assertEqual(len(self.model.row_cache), 0)
+        self.assertTrue(self.model.data(self.model.index(0, 1)).endswith("b" * 16))
+
+
+class TestBatchOperationsModel(unittest.TestCase):
+    def setUp(self):
+        self.model = BatchOperationsModel()
+        self.recorder = SignalRecorder(self.model)
+        self.model.append_operations([({"type": "read"}, "read", "block=1"), ({"type": "erase"}, "erase", "block=2")])
+
+    def test_append_operations(self):
+        self.assertEqual(self.model.operations, [{"type": "read"}, {"type": "erase"}])
+        self.assertEqual(column(self.model, 0), ["read", "erase"])
+        self.assertEqual(column(self.model, 2), ["Pending", "Pending"])
+        self.model.append_operations([({"type": "write"}, "write", "block=3")])
+        self.assertEqual(self.recorder.events, [("inserted", 0, 1), ("inserted", 2, 2)])
+
+    def test_append_no_operations(self):
+        self.model.append_operations([])
+        self.assertEqual(self.recorder.events, [("inserted", 0, 1)])
+
+    def test_set_status_emits_single_cell_change(self):
+        self.model.set_status(1, "Completed")
+        self.assertEqual(column(self.model, 2), ["Pending", "Completed"])
+        self.assertEqual(self.recorder.events[-1], ("changed", 1, 2, 1, 2))
+
+    def test_set_status_unchanged_emits_nothing(self):
+        self.model.set_status(0, "Pending")
+        self.assertEqual(self.recorder.events, [("inserted", 0, 1)])
+
+    def test_clear(self):
+        self.model.clear()
+        self.assertEqual(self.model.rowCount(), 0)
+        self.assertEqual(self.model.operations, [])
+        self.assertEqual(self.recorder.events[-1], ("reset",))
+
+
+if __name__ == "__main__":
+    unittest.main()